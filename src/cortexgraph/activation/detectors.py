@@ -13,6 +13,12 @@ from cortexgraph.activation.entity_extraction import extract_entities
 from cortexgraph.activation.models import ActivationSignal, MessageAnalysis, RecallAnalysis
 from cortexgraph.activation.patterns import PatternMatcher
 
+# Keyword heuristics, matched as substrings of lowercased text
+_DECISION_KEYWORDS = ("decided", "choice", "decision", "prefer", "preference")
+_PAST_KEYWORDS = ("said", "told", "discussed", "mentioned", "last time", "previously")
+_DATABASE_TAG_KEYWORDS = ("database", "postgres", "mongodb", "redis")
+_API_TAG_KEYWORDS = ("api", "rest", "graphql", "http")
+
 
 def sigmoid(x: float) -> float:
     """Sigmoid activation function.
@@ -131,8 +137,8 @@ def detect_save_intent(
         signals["entity_count"] = entity_contribution
 
     # Decision/preference detection (heuristic)
-    decision_keywords = ["decided", "choice", "decision", "prefer", "preference"]
-    if any(kw in message.lower() for kw in decision_keywords):
+    message_lower = message.lower()
+    if any(kw in message_lower for kw in _DECISION_KEYWORDS):
         signals["preference_statement"] = get_signal_weight(config, "preference_statement")
         phrase_signals["decision_marker"] = True
 
@@ -153,13 +159,12 @@ def detect_save_intent(
 
     # Generate tags (simple heuristic from entities)
     suggested_tags: list[str] = []
-    if any(
-        tech in " ".join(entities).lower() for tech in ["database", "postgres", "mongodb", "redis"]
-    ):
+    entity_text = " ".join(entities).lower()
+    if any(tech in entity_text for tech in _DATABASE_TAG_KEYWORDS):
         suggested_tags.append("database")
-    if any(tech in " ".join(entities).lower() for tech in ["api", "rest", "graphql", "http"]):
+    if any(tech in entity_text for tech in _API_TAG_KEYWORDS):
         suggested_tags.append("api")
-    if "decision" in phrase_signals or "preference" in message.lower():
+    if "decision" in phrase_signals or "preference" in message_lower:
         suggested_tags.append("preference")
 
     # Build reasoning string
@@ -218,19 +223,19 @@ def detect_recall_intent(
         phrase_signals["recall_request"] = True
 
     # Past reference detection (heuristic)
-    past_keywords = ["said", "told", "discussed", "mentioned", "last time", "previously"]
-    if any(kw in query.lower() for kw in past_keywords):
+    query_lower = query.lower()
+    if any(kw in query_lower for kw in _PAST_KEYWORDS):
         signals["past_reference"] = 2.0
         phrase_signals["past_reference"] = True
 
     # Question markers (questions more likely to be recall)
-    question_markers = ["what", "when", "where", "who", "which", "how"]
-    if any(query.lower().startswith(qm) for qm in question_markers):
+    question_markers = ("what", "when", "where", "who", "which", "how")
+    if query_lower.startswith(question_markers):
         signals["question_marker"] = 1.5
         phrase_signals["question_marker"] = True
 
     # Possessive references ("my X") suggest recall
-    if any(poss in query.lower() for poss in ["my ", "our "]):
+    if "my " in query_lower or "our " in query_lower:
         signals["possessive_reference"] = 2.0
         phrase_signals["possessive_reference"] = True
 
@@ -15,10 +15,15 @@ Entity types extracted:
 - URLs and email addresses
 """
 
+from functools import lru_cache
+
 from cortexgraph.preprocessing.entity_extractor import EntityExtractor
 
 __all__ = ["EntityExtractor", "extract_entities"]
 
+# Shared extractor behind extract_entities(), created lazily
+_default_extractor: EntityExtractor | None = None
+
 
 def extract_entities(text: str, max_entities: int = 10) -> list[str]:
     """Extract named entities from text using default extractor.
@@ -39,8 +44,17 @@ def extract_entities(text: str, max_entities: int = 10) -> list[str]:
         True
 
     Note:
-        This creates a new EntityExtractor each call. For repeated extractions,
-        create an EntityExtractor instance and reuse it.
+        Uses a shared EntityExtractor created on first call. Results are
+        cached per process (LRU, 256 entries), so repeated messages are not
+        re-analyzed; call _extract_entities_cached.cache_clear() to reset.
     """
-    extractor = EntityExtractor()
-    return extractor.extract(text, max_entities=max_entities)
+    return list(_extract_entities_cached(text, max_entities))
+
+
+@lru_cache(maxsize=256)
+def _extract_entities_cached(text: str, max_entities: int) -> tuple[str, ...]:
+    """Run the shared extractor, returning an immutable result for caching."""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = EntityExtractor()
+    return tuple(_default_extractor.extract(text, max_entities=max_entities))
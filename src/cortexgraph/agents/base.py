@@ -235,15 +235,8 @@ class ConsolidationAgent(ABC, Generic[T]):
 
         for item_id in items:
             # Rate limiting (T008)
-            if not self._rate_limiter.acquire():
-                wait_time = self._rate_limiter.time_until_available()
-                logger.warning(
-                    f"Rate limit exceeded. Waiting {wait_time:.2f}s "
-                    f"(processed {self._processed_count}/{len(items)})"
-                )
-                if not self._rate_limiter.wait_and_acquire(timeout=wait_time + 1):
-                    logger.error("Rate limit timeout - stopping execution")
-                    break
+            if not self._acquire_rate_limit(len(items)):
+                break
 
             try:
                 # Process item (respects dry_run mode in subclass)
@@ -271,6 +264,28 @@ class ConsolidationAgent(ABC, Generic[T]):
 
         return results
 
+    def _acquire_rate_limit(self, total: int) -> bool:
+        """Take one operation from the rate limiter, waiting if the window is full.
+
+        Args:
+            total: Number of items in the current run (for logging)
+
+        Returns:
+            True if the operation may proceed, False if waiting timed out
+        """
+        if self._rate_limiter.acquire():
+            return True
+
+        wait_time = self._rate_limiter.time_until_available()
+        logger.warning(
+            f"Rate limit exceeded. Waiting {wait_time:.2f}s "
+            f"(processed {self._processed_count}/{total})"
+        )
+        if not self._rate_limiter.wait_and_acquire(timeout=wait_time + 1):
+            logger.error("Rate limit timeout - stopping execution")
+            return False
+        return True
+
     def get_stats(self) -> dict[str, int]:
         """Return execution statistics."""
         return {
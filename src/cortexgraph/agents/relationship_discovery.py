@@ -17,8 +17,12 @@ From contracts/agent-api.md:
 
 from __future__ import annotations
 
+import itertools
 import logging
 import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from cortexgraph.agents.base import ConsolidationAgent
@@ -57,6 +61,9 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
         rate_limit: int = 100,
         min_confidence: float = 0.3,
         min_shared_entities: int = 1,
+        storage: "JSONLStorage | None" = None,
+        create_issue: Callable[..., str] | None = None,
+        close_issue: Callable[..., None] | None = None,
     ) -> None:
         """Initialize RelationshipDiscovery agent.
 
@@ -65,12 +72,38 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
             rate_limit: Max operations per minute
             min_confidence: Minimum confidence threshold for relations (0.0-1.0)
             min_shared_entities: Minimum shared entities for candidate detection
+            storage: Storage to scan (default: lazily resolved via get_storage())
+            create_issue: Beads issue creator (default: create_consolidation_issue)
+            close_issue: Beads issue closer (default: beads_integration.close_issue)
         """
         super().__init__(dry_run=dry_run, rate_limit=rate_limit)
-        self._storage: "JSONLStorage | None" = None
+        self._storage: "JSONLStorage | None" = storage
+        self._create_issue = create_issue
+        self._close_issue = close_issue
         self._min_confidence = min_confidence
         self._min_shared_entities = min_shared_entities
         self._candidate_cache: dict[str, tuple[str, str, set[str]]] = {}
+        # Memory ID -> entity set, built once per scan() and reused when scoring
+        self._entity_sets: dict[str, frozenset[str]] = {}
+        # Endpoints -> pair ID for the last scan(), for O(1) pair lookup
+        self.candidate_pairs: dict[frozenset[str], str] = {}
+
+    @staticmethod
+    def make_pair_id(mem_id_1: str, mem_id_2: str) -> str:
+        """Build the canonical pair ID for two memories.
+
+        Endpoints are sorted, so both argument orders give the ID that
+        scan() returns for the pair.
+
+        Args:
+            mem_id_1: First memory ID
+            mem_id_2: Second memory ID
+
+        Returns:
+            Pair ID in format "mem-id-1:mem-id-2"
+        """
+        low, high = sorted((mem_id_1, mem_id_2))
+        return f"{low}:{high}"
 
     @property
     def storage(self) -> "JSONLStorage":
@@ -83,7 +116,8 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
         """Scan storage for memory pairs with potential relationships.
 
         Returns:
-            List of pair IDs in format "mem-id-1:mem-id-2"
+            List of pair IDs in format "mem-id-1:mem-id-2". The same IDs are
+            also exposed in ``candidate_pairs``, keyed by their endpoints.
 
         Contract:
             - MUST find memories with potential connections
@@ -92,6 +126,8 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
         """
         candidates: list[str] = []
         self._candidate_cache = {}
+        self._entity_sets = {}
+        self.candidate_pairs = {}
 
         # Get all active memories
         memories: dict[str, Memory] = {}
@@ -117,54 +153,34 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
             if getattr(m, "status", MemoryStatus.ACTIVE) == MemoryStatus.ACTIVE
         }
 
-        # Build entity index for faster lookup
-        entity_to_memories: dict[str, set[str]] = {}
+        # Build inverted index: entity -> active memory IDs
+        entity_to_memories: dict[str, list[str]] = defaultdict(list)
         for mid, memory in active_memories.items():
-            entities = getattr(memory, "entities", []) or []
+            entities = frozenset(getattr(memory, "entities", []) or [])
+            self._entity_sets[mid] = entities
             for entity in entities:
-                if entity not in entity_to_memories:
-                    entity_to_memories[entity] = set()
-                entity_to_memories[entity].add(mid)
+                entity_to_memories[entity].append(mid)
 
-        # Find pairs with shared entities
-        seen_pairs: set[tuple[str, str]] = set()
         existing_relations = self._get_existing_relation_pairs()
 
-        for _entity, memory_ids in entity_to_memories.items():
+        # Accumulate shared entities per pair from the posting lists, so pairs
+        # with no entity in common are never compared
+        shared_by_pair: dict[tuple[str, str], set[str]] = defaultdict(set)
+        for entity, memory_ids in entity_to_memories.items():
             if len(memory_ids) < 2:
                 continue
-
-            memory_list = list(memory_ids)
-            for i in range(len(memory_list)):
-                for j in range(i + 1, len(memory_list)):
-                    mid1, mid2 = memory_list[i], memory_list[j]
-
-                    # Normalize pair order for deduplication
-                    pair = (min(mid1, mid2), max(mid1, mid2))
-
-                    # Skip if already seen or already related
-                    if pair in seen_pairs:
-                        continue
-                    if pair in existing_relations:
-                        continue
-
-                    seen_pairs.add(pair)
-
-                    # Calculate shared entities for this pair
-                    try:
-                        mem1 = active_memories[mid1]
-                        mem2 = active_memories[mid2]
-                        entities1 = set(getattr(mem1, "entities", []) or [])
-                        entities2 = set(getattr(mem2, "entities", []) or [])
-                        shared = entities1 & entities2
-
-                        if len(shared) >= self._min_shared_entities:
-                            pair_id = f"{pair[0]}:{pair[1]}"
-                            candidates.append(pair_id)
-                            self._candidate_cache[pair_id] = (pair[0], pair[1], shared)
-                            logger.debug(f"Relationship candidate: {pair_id} (shared: {shared})")
-                    except Exception as e:
-                        logger.warning(f"Error checking pair {pair}: {e}")
+            # Sorted IDs yield normalized (min, max) pairs
+            for pair in itertools.combinations(sorted(memory_ids), 2):
+                if pair not in existing_relations:
+                    shared_by_pair[pair].add(entity)
+
+        for pair, shared in shared_by_pair.items():
+            if len(shared) >= self._min_shared_entities:
+                pair_id = self.make_pair_id(*pair)
+                candidates.append(pair_id)
+                self._candidate_cache[pair_id] = (pair[0], pair[1], shared)
+                self.candidate_pairs[frozenset(pair)] = pair_id
+                logger.debug(f"Relationship candidate: {pair_id} (shared: {shared})")
 
         logger.info(f"RelationshipDiscovery scan found {len(candidates)} relationship candidates")
         return candidates
@@ -229,6 +245,82 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
             ValueError: If memory_id is invalid or memories not found
             RuntimeError: If relation creation fails
         """
+        return self._apply_pair_score(memory_id, self._score_pair(memory_id))
+
+    def process_batch(
+        self, pair_ids: list[str], executor: Executor | None = None
+    ) -> list[RelationResult]:
+        """Process many memory pairs, scoring them concurrently.
+
+        Scoring only reads storage, so it is fanned out across a thread pool.
+        Relation creation and beads issues then run serially on the calling
+        thread, in input order, to keep JSONL appends ordered. Like run(),
+        each applied pair takes one operation from the rate limiter, a pair
+        that fails is logged and counted rather than aborting the batch, and
+        the processed/error counts in get_stats() describe this batch.
+
+        Args:
+            pair_ids: Pair identifiers in format "mem-id-1:mem-id-2"
+            executor: Executor to score on. If None, a temporary
+                ThreadPoolExecutor is created for this call.
+
+        Returns:
+            RelationResult per successfully processed pair, in input order.
+            Stops early if the rate limiter times out.
+        """
+        self._processed_count = 0
+        self._skipped_count = 0
+        self._error_count = 0
+
+        if not pair_ids:
+            return []
+
+        if executor is None:
+            with ThreadPoolExecutor() as pool:
+                scores = list(pool.map(self._score_pair_or_error, pair_ids))
+        else:
+            scores = list(executor.map(self._score_pair_or_error, pair_ids))
+
+        results: list[RelationResult] = []
+        for pair_id, score in zip(pair_ids, scores, strict=True):
+            if not self._acquire_rate_limit(len(pair_ids)):
+                break
+
+            try:
+                if isinstance(score, Exception):
+                    raise score
+                results.append(self._apply_pair_score(pair_id, score))
+                self._processed_count += 1
+            except Exception as e:
+                self._error_count += 1
+                logger.error(f"Error processing {pair_id}: {e}", exc_info=True)
+
+        return results
+
+    def _score_pair_or_error(
+        self, memory_id: str
+    ) -> tuple[str, str, set[str], float, float, str] | Exception:
+        """Score a pair, returning the exception instead of raising it.
+
+        Lets process_batch count failures per pair after concurrent scoring.
+        """
+        try:
+            return self._score_pair(memory_id)
+        except Exception as e:
+            return e
+
+    def _score_pair(self, memory_id: str) -> tuple[str, str, set[str], float, float, str]:
+        """Score a memory pair without touching storage state.
+
+        Args:
+            memory_id: Pair identifier in format "mem-id-1:mem-id-2"
+
+        Returns:
+            Tuple of (mem_id_1, mem_id_2, shared_entities, strength, confidence, reasoning)
+
+        Raises:
+            ValueError: If memory_id is invalid or memories not found
+        """
         # Parse pair ID
         if ":" not in memory_id:
             raise ValueError(f"Invalid pair ID format: {memory_id}")
@@ -252,15 +344,34 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
             if mem2 is None:
                 raise ValueError(f"Memory not found: {mem_id_2}")
 
-            entities1 = set(getattr(mem1, "entities", []) or [])
-            entities2 = set(getattr(mem2, "entities", []) or [])
-            shared_entities = entities1 & entities2
+            shared_entities = set(
+                self._get_entity_set(mem_id_1, mem1) & self._get_entity_set(mem_id_2, mem2)
+            )
 
         # Calculate relation strength and confidence
         strength, confidence, reasoning = self._calculate_relation_metrics(
             mem_id_1, mem_id_2, shared_entities
         )
 
+        return mem_id_1, mem_id_2, shared_entities, strength, confidence, reasoning
+
+    def _apply_pair_score(
+        self, memory_id: str, score: tuple[str, str, set[str], float, float, str]
+    ) -> RelationResult:
+        """Build the result for a scored pair, creating the relation in live mode.
+
+        Args:
+            memory_id: Pair identifier in format "mem-id-1:mem-id-2"
+            score: Output of _score_pair for this pair
+
+        Returns:
+            RelationResult with relationship outcome
+
+        Raises:
+            RuntimeError: If relation creation fails
+        """
+        mem_id_1, mem_id_2, shared_entities, strength, confidence, reasoning = score
+
         # Generate new relation ID
         relation_id = str(uuid.uuid4())
 
@@ -299,9 +410,13 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
                 beads_issue_id=None,
             )
 
+        # Injected callables win; otherwise resolve the module functions at call time
+        create_issue = self._create_issue or create_consolidation_issue
+        close = self._close_issue or close_issue
+
         try:
             # Create beads issue for audit trail
-            issue_id = create_consolidation_issue(
+            issue_id = create_issue(
                 agent="relations",
                 memory_ids=[mem_id_1, mem_id_2],
                 action="relate",
@@ -334,7 +449,7 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
             logger.info(f"Created relation {relation_id}: {mem_id_1} <-> {mem_id_2}")
 
             # Close beads issue
-            close_issue(issue_id, f"Created relation {relation_id}")
+            close(issue_id, f"Created relation {relation_id}")
 
             return RelationResult(
                 from_memory_id=mem_id_1,
@@ -366,6 +481,21 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
 
         return None
 
+    def _get_entity_set(self, memory_id: str, memory: Memory) -> frozenset[str]:
+        """Get a memory's entities as a set, reusing the one built by scan().
+
+        Args:
+            memory_id: Memory ID
+            memory: Memory object, used when scan() has not seen this memory
+
+        Returns:
+            Frozen set of the memory's entities
+        """
+        entities = self._entity_sets.get(memory_id)
+        if entities is None:
+            entities = frozenset(getattr(memory, "entities", []) or [])
+        return entities
+
     def _calculate_relation_metrics(
         self, mem_id_1: str, mem_id_2: str, shared_entities: set[str]
     ) -> tuple[float, float, str]:
@@ -386,8 +516,8 @@ class RelationshipDiscovery(ConsolidationAgent[RelationResult]):
             return 0.0, 0.0, "Memory not found"
 
         # Get entity and tag sets
-        entities1 = set(getattr(mem1, "entities", []) or [])
-        entities2 = set(getattr(mem2, "entities", []) or [])
+        entities1 = self._get_entity_set(mem_id_1, mem1)
+        entities2 = self._get_entity_set(mem_id_2, mem2)
         # Tags are stored in meta.tags for real Memory model, but tests may use direct tags
         # Try meta.tags first, fall back to direct tags attribute
         meta1 = getattr(mem1, "meta", None)
@@ -1,6 +1,6 @@
 """Core logic for temporal decay, scoring, clustering, and pagination."""
 
-from .decay import calculate_decay_lambda, calculate_score
+from .decay import calculate_decay_lambda, calculate_score, calculate_scores
 from .pagination import (
     DEFAULT_PAGE_SIZE,
     MAX_PAGE_SIZE,
@@ -22,6 +22,7 @@ from .text_utils import truncate_content
 
 __all__ = [
     "calculate_score",
+    "calculate_scores",
     "calculate_decay_lambda",
     "should_promote",
     "should_forget",
@@ -8,12 +8,18 @@ Supports multiple decay models:
 
 import math
 import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
 
 # Re-export math utilities for backward compatibility with existing imports
 # These functions were refactored to math_utils.py but are imported here to maintain
 # the public API (used by core/__init__.py and server.py)
 from .math_utils import calculate_decay_lambda, calculate_halflife  # noqa: F401
 
+if TYPE_CHECKING:
+    from ..config import Config
+    from ..storage.models import Memory
+
 # Constants
 SECONDS_PER_DAY = 86400.0
 SECONDS_PER_HOUR = 3600.0
@@ -23,6 +29,35 @@ BISECTION_EXPANSION_ITERATIONS = 32
 BISECTION_PRECISION_ITERATIONS = 60
 
 
+def _decay_function(config: "Config", lambda_: float | None) -> Callable[[float], float]:
+    """Select the decay curve ``f(dt)`` used by calculate_score.
+
+    Resolving the model (and power-law ``t0``) once lets batch callers reuse
+    the curve for every memory instead of re-deriving it per score.
+    """
+    # If lambda_ explicitly provided, force exponential path
+    if lambda_ is not None and (getattr(config, "decay_model", "power_law") != "exponential"):
+        return lambda dt: math.exp(-lambda_ * dt)
+
+    model = getattr(config, "decay_model", "power_law")
+    if model == "power_law":
+        # Derive t0 from alpha and target half-life
+        alpha = config.pl_alpha
+        t_half = config.pl_halflife_days * SECONDS_PER_DAY
+        # t0 = H / (2^(1/alpha) - 1)
+        denom = math.pow(2.0, 1.0 / alpha) - 1.0
+        t0 = t_half / denom if denom > 0 else t_half
+        return lambda dt: math.pow(1.0 + (dt / t0), -alpha)
+    if model == "two_component":
+        w = config.tc_weight_fast
+        lambda_fast = config.tc_lambda_fast
+        lambda_slow = config.tc_lambda_slow
+        return lambda dt: w * math.exp(-lambda_fast * dt) + (1.0 - w) * math.exp(-lambda_slow * dt)
+    # exponential
+    rate = config.decay_lambda if lambda_ is None else lambda_
+    return lambda dt: math.exp(-rate * dt)
+
+
 def calculate_score(
     use_count: int,
     last_used: int,
@@ -54,30 +89,49 @@ def calculate_score(
     # Add 1 to use_count so new memories (use_count=0) don't get zero score
     # This gives new memories a grace period before decay dominates
     use_component = math.pow(use_count + 1, beta)
-    # If lambda_ explicitly provided, force exponential path
-    if lambda_ is not None and (getattr(config, "decay_model", "power_law") != "exponential"):
-        decay_component = math.exp(-lambda_ * time_delta)
-    else:
-        model = getattr(config, "decay_model", "power_law")
-        if model == "power_law":
-            # Derive t0 from alpha and target half-life
-            alpha = config.pl_alpha
-            t_half = config.pl_halflife_days * SECONDS_PER_DAY
-            # t0 = H / (2^(1/alpha) - 1)
-            denom = math.pow(2.0, 1.0 / alpha) - 1.0
-            t0 = t_half / denom if denom > 0 else t_half
-            decay_component = math.pow(1.0 + (time_delta / t0), -alpha)
-        elif model == "two_component":
-            w = config.tc_weight_fast
-            decay_component = w * math.exp(-config.tc_lambda_fast * time_delta) + (
-                1.0 - w
-            ) * math.exp(-config.tc_lambda_slow * time_delta)
-        else:  # exponential
-            decay_component = math.exp(-lambda_ * time_delta)
+    decay_component = _decay_function(config, lambda_)(time_delta)
 
     return use_component * decay_component * strength
 
 
+def calculate_scores(
+    memories: Iterable["Memory"],
+    now: int | None = None,
+    lambda_: float | None = None,
+    beta: float | None = None,
+) -> list[float]:
+    """Calculate current scores for many memories at once.
+
+    Equivalent to calling calculate_score for each memory, but the config,
+    decay model and timestamp are resolved once for the whole batch.
+
+    Args:
+        memories: Memories to score
+        now: Current timestamp (defaults to current time)
+        lambda_: Decay constant (defaults to config value)
+        beta: Use count exponent (defaults to config value)
+
+    Returns:
+        Scores in the same order as ``memories``
+    """
+    from ..config import get_config
+
+    if now is None:
+        now = int(time.time())
+
+    config = get_config()
+    if lambda_ is None:
+        lambda_ = config.decay_lambda
+    if beta is None:
+        beta = config.decay_beta
+
+    decay = _decay_function(config, lambda_)
+    return [
+        math.pow(m.use_count + 1, beta) * decay(max(0, now - m.last_used)) * m.strength
+        for m in memories
+    ]
+
+
 def time_until_threshold(
     current_score: float,
     threshold: float,
@@ -110,20 +164,8 @@ def time_until_threshold(
     # Factor out K * f(dt). Let f be decay function; current_score = K * f(elapsed).
     elapsed = now - last_used
 
-    def f(dt: float) -> float:
-        model = getattr(config, "decay_model", "power_law")
-        if model == "power_law":
-            alpha = config.pl_alpha
-            t_half = config.pl_halflife_days * SECONDS_PER_DAY
-            denom = math.pow(2.0, 1.0 / alpha) - 1.0
-            t0 = t_half / denom if denom > 0 else t_half
-            return math.pow(1.0 + (dt / t0), -alpha)
-        elif model == "two_component":
-            return config.tc_weight_fast * math.exp(-config.tc_lambda_fast * dt) + (
-                1.0 - config.tc_weight_fast
-            ) * math.exp(-config.tc_lambda_slow * dt)
-        else:
-            return math.exp(-config.decay_lambda * dt)
+    # Resolve the curve once; bisection evaluates it ~100 times
+    f = _decay_function(config, None)
 
     # We want t such that K*f(elapsed + t) = threshold; K = current_score / f(elapsed)
     # => f(elapsed + t) = threshold * f(elapsed) / current_score
@@ -2,6 +2,9 @@
 
 import math
 
+LN2 = math.log(2)
+SECONDS_PER_DAY = 86400
+
 
 def calculate_decay_lambda(halflife_days: float) -> float:
     """
@@ -15,8 +18,7 @@ def calculate_decay_lambda(halflife_days: float) -> float:
     Returns:
         Decay constant (lambda) for exponential decay
     """
-    halflife_seconds = halflife_days * 86400
-    return math.log(2) / halflife_seconds
+    return LN2 / (halflife_days * SECONDS_PER_DAY)
 
 
 def calculate_halflife(lambda_: float) -> float:
@@ -29,5 +31,4 @@ def calculate_halflife(lambda_: float) -> float:
     Returns:
         Half-life in days
     """
-    halflife_seconds = math.log(2) / lambda_
-    return halflife_seconds / 86400
+    return LN2 / lambda_ / SECONDS_PER_DAY
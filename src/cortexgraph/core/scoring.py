@@ -4,7 +4,7 @@ import time
 
 from ..config import get_config
 from ..storage.models import Memory
-from .decay import calculate_score
+from .decay import calculate_score, calculate_scores
 
 
 def should_forget(memory: Memory, now: int | None = None) -> tuple[bool, float]:
@@ -93,15 +93,7 @@ def rank_memories_by_score(
     if now is None:
         now = int(time.time())
 
-    scored = []
-    for memory in memories:
-        score = calculate_score(
-            use_count=memory.use_count,
-            last_used=memory.last_used,
-            strength=memory.strength,
-            now=now,
-        )
-        scored.append((memory, score))
+    scored = list(zip(memories, calculate_scores(memories, now=now), strict=True))
 
     # Sort by score descending
     scored.sort(key=lambda x: x[1], reverse=True)
@@ -126,18 +118,11 @@ def filter_by_score(
     if now is None:
         now = int(time.time())
 
-    filtered = []
-    for memory in memories:
-        score = calculate_score(
-            use_count=memory.use_count,
-            last_used=memory.last_used,
-            strength=memory.strength,
-            now=now,
-        )
-        if score >= min_score:
-            filtered.append((memory, score))
-
-    return filtered
+    return [
+        (memory, score)
+        for memory, score in zip(memories, calculate_scores(memories, now=now), strict=True)
+        if score >= min_score
+    ]
 
 
 def calculate_memory_age(memory: Memory, now: int | None = None) -> float:
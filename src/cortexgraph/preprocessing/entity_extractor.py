@@ -11,10 +11,12 @@ Phase 1 Implementation (v0.6.0):
 """
 
 import re
+from functools import cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from spacy.language import Language  # pyright: ignore[reportMissingImports]
+    from spacy.tokens import Doc  # pyright: ignore[reportMissingImports]
 
 try:
     import spacy  # pyright: ignore[reportMissingImports]
@@ -26,6 +28,62 @@ except ImportError:
     SPACY_AVAILABLE = False
 
 
+# Technology/AI-specific patterns (case-insensitive)
+_TECH_PATTERNS = [
+    # AI/ML Models
+    r"\b(?:GPT-?\d+|Claude|Gemini|LLaMA|BERT|T5)\b",
+    # Frameworks
+    r"\b(?:PyTorch|TensorFlow|FastAPI|Django|React|Vue)\b",
+    # Languages
+    r"\b(?:Python|JavaScript|TypeScript|Rust|Go|Java)\b",
+    # Protocols
+    r"\b(?:MCP|HTTP|gRPC|WebSocket|REST)\b",
+    # Databases
+    r"\b(?:PostgreSQL|MongoDB|Redis|SQLite)\b",
+]
+
+_TECH_REGEX = re.compile("|".join(_TECH_PATTERNS), re.IGNORECASE)
+
+# Fallback patterns if spaCy unavailable
+_FALLBACK_PATTERNS = [
+    # Capitalized words (likely proper nouns)
+    r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
+    # Email addresses (as identifiers)
+    r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+    # URLs (as references)
+    r"https?://[^\s]+",
+]
+
+_FALLBACK_REGEX = re.compile("|".join(_FALLBACK_PATTERNS), re.MULTILINE)
+
+# Common stopwords that slip through pattern or NER matching
+STOPWORDS: frozenset[str] = frozenset(
+    {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"}
+)
+
+
+@cache
+def _load_spacy_model(model_name: str) -> "Language | None":
+    """Load a spaCy model once per process.
+
+    Extractors are created per call in several tools, so both successful loads
+    and missing models are cached to avoid repeating the load or disk probe.
+
+    Args:
+        model_name: spaCy model to load
+
+    Returns:
+        Loaded pipeline, or None if spaCy or the model is unavailable
+    """
+    if not SPACY_AVAILABLE or spacy is None:
+        return None
+    try:
+        return spacy.load(model_name)  # pyright: ignore[reportOptionalMemberAccess]
+    except OSError:
+        # Model not downloaded - will use fallback patterns
+        return None
+
+
 class EntityExtractor:
     """Extract named entities from natural language.
 
@@ -47,42 +105,13 @@ class EntityExtractor:
             model_name: spaCy model to use (default: en_core_web_sm)
                        Download with: python -m spacy download en_core_web_sm
         """
-        self.nlp: "Language | None" = None
-
-        if SPACY_AVAILABLE and spacy is not None:
-            try:
-                self.nlp = spacy.load(model_name)  # pyright: ignore[reportOptionalMemberAccess]
-            except OSError:
-                # Model not downloaded - will use fallback patterns
-                pass
-
-        # Technology/AI-specific patterns (case-insensitive)
-        self.tech_patterns = [
-            # AI/ML Models
-            r"\b(?:GPT-?\d+|Claude|Gemini|LLaMA|BERT|T5)\b",
-            # Frameworks
-            r"\b(?:PyTorch|TensorFlow|FastAPI|Django|React|Vue)\b",
-            # Languages
-            r"\b(?:Python|JavaScript|TypeScript|Rust|Go|Java)\b",
-            # Protocols
-            r"\b(?:MCP|HTTP|gRPC|WebSocket|REST)\b",
-            # Databases
-            r"\b(?:PostgreSQL|MongoDB|Redis|SQLite)\b",
-        ]
-
-        self.tech_regex = re.compile("|".join(self.tech_patterns), re.IGNORECASE)
-
-        # Fallback patterns if spaCy unavailable
-        self.fallback_patterns = [
-            # Capitalized words (likely proper nouns)
-            r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b",
-            # Email addresses (as identifiers)
-            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            # URLs (as references)
-            r"https?://[^\s]+",
-        ]
-
-        self.fallback_regex = re.compile("|".join(self.fallback_patterns), re.MULTILINE)
+        self.nlp: "Language | None" = _load_spacy_model(model_name)
+
+        # Patterns are compiled once at import and shared by every instance
+        self.tech_patterns = _TECH_PATTERNS
+        self.tech_regex = _TECH_REGEX
+        self.fallback_patterns = _FALLBACK_PATTERNS
+        self.fallback_regex = _FALLBACK_REGEX
 
     def extract(self, text: str, max_entities: int = 10) -> list[str]:
         """Extract named entities from text.
@@ -102,6 +131,50 @@ class EntityExtractor:
             >>> "gpt-4" in entities
             True
         """
+        # Blank input has no entities; skip the spaCy pipeline entirely
+        if not text or text.isspace():
+            return []
+
+        doc = self.nlp(text) if self.nlp is not None else None
+        return self._collect_entities(text, doc, max_entities)
+
+    def extract_batch(self, texts: list[str], max_entities: int = 10) -> list[list[str]]:
+        """Extract named entities from many texts.
+
+        With spaCy available, texts are streamed through ``nlp.pipe`` so the
+        pipeline batches its work instead of running once per text. Blank
+        texts are left out of the pipeline and yield empty lists.
+
+        Args:
+            texts: Natural language texts to analyze
+            max_entities: Maximum entities to return per text (default: 10)
+
+        Returns:
+            One entity list per input text, each as returned by extract()
+        """
+        results: list[list[str]] = [[] for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and not text.isspace()]
+        if self.nlp is None:
+            for i in indices:
+                results[i] = self._collect_entities(texts[i], None, max_entities)
+            return results
+
+        docs = self.nlp.pipe([texts[i] for i in indices])
+        for i, doc in zip(indices, docs, strict=True):
+            results[i] = self._collect_entities(texts[i], doc, max_entities)
+        return results
+
+    def _collect_entities(self, text: str, doc: "Doc | None", max_entities: int) -> list[str]:
+        """Combine pattern and NER entities for one text.
+
+        Args:
+            text: Original text
+            doc: spaCy Doc for the text, or None to use the regex fallback
+            max_entities: Maximum entities to return
+
+        Returns:
+            List of entity strings (lowercase, deduplicated)
+        """
         entities: set[str] = set()
 
         # Extract technology-specific entities first (always run)
@@ -109,8 +182,7 @@ class EntityExtractor:
         entities.update(m.lower() for m in tech_matches)
 
         # Use spaCy if available
-        if self.nlp is not None:
-            doc = self.nlp(text)
+        if doc is not None:
             for ent in doc.ents:
                 # Focus on most useful entity types for memory
                 if ent.label_ in {
@@ -127,20 +199,7 @@ class EntityExtractor:
             entities.update(m.lower() for m in fallback_matches)
 
         # Remove common stopwords that slip through
-        stopwords = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-        }
-        entities = {e for e in entities if e not in stopwords}
+        entities -= STOPWORDS
 
         # Return top max_entities by length (longer = more specific)
         sorted_entities = sorted(entities, key=len, reverse=True)
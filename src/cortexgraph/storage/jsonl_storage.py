@@ -23,12 +23,14 @@ from .models import KnowledgeGraph, Memory, MemoryStatus, Relation
 class JSONLStorage:
     """JSONL-based storage with in-memory indexing."""
 
-    def __init__(self, storage_path: Path | None = None) -> None:
+    def __init__(self, storage_path: Path | None = None, persist: bool = True) -> None:
         """
         Initialize JSONL storage.
 
         Args:
             storage_path: Path to storage directory. If None, uses config default.
+            persist: If False, keep all changes in memory only and never write to
+                the JSONL files (useful for tests).
         """
         config = get_config()
 
@@ -41,7 +43,9 @@ class JSONLStorage:
                 storage_path if isinstance(storage_path, Path) else Path(storage_path)
             )
 
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.persist = persist
+        if self.persist:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
 
         self.memories_path = self.storage_dir / config.stm_memories_filename
         self.relations_path = self.storage_dir / config.stm_relations_filename
@@ -75,7 +79,8 @@ class JSONLStorage:
         """
         path = value if isinstance(value, Path) else Path(value)
         self.storage_dir = path
-        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        if self.persist:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
         config = get_config()
         self.memories_path = self.storage_dir / config.stm_memories_filename
         self.relations_path = self.storage_dir / config.stm_relations_filename
@@ -200,6 +205,9 @@ class JSONLStorage:
 
     def _append_memory(self, memory: Memory) -> None:
         """Append memory to JSONL file and secure permissions."""
+        if not self.persist:
+            return
+
         file_created = not self.memories_path.exists()
 
         # Use buffered writing for better performance
@@ -218,6 +226,9 @@ class JSONLStorage:
 
     def _append_relation(self, relation: Relation) -> None:
         """Append relation to JSONL file and secure permissions."""
+        if not self.persist:
+            return
+
         file_created = not self.relations_path.exists()
 
         # Use buffered writing for better performance
@@ -235,6 +246,9 @@ class JSONLStorage:
 
     def _append_deletion_marker(self, memory_id: str, is_relation: bool = False) -> None:
         """Append a deletion marker to JSONL file and secure permissions."""
+        if not self.persist:
+            return
+
         marker = {"id": memory_id, "_deleted": True}
 
         if is_relation:
@@ -290,14 +304,18 @@ class JSONLStorage:
 
         # Update in-memory indexes
         for memory in memories:
+            old_memory = self._memories.get(memory.id)
             self._memories[memory.id] = memory
+            self._update_tag_index(memory, old_memory)
 
-        # Batch write to JSONL file
+        if not self.persist:
+            return
+
+        # Serialize up front so the whole batch goes out in a single write
+        payload = "".join(json.dumps(memory.model_dump(mode="json")) + "\n" for memory in memories)
         file_created = not self.memories_path.exists()
         with open(self.memories_path, "a", buffering=8192) as f:
-            for memory in memories:
-                data = memory.model_dump(mode="json")
-                f.write(json.dumps(data) + "\n")
+            f.write(payload)
 
         # Secure file permissions if newly created
         if file_created:
@@ -440,6 +458,9 @@ class JSONLStorage:
             del self._memories[memory_id]
             self._deleted_memory_ids.add(memory_id)
 
+        if not self.persist:
+            return len(existing_ids)
+
         # Batch write deletion markers
         file_created = not self.memories_path.exists()
         with open(self.memories_path, "a", buffering=8192) as f:
@@ -640,6 +661,9 @@ class JSONLStorage:
         for relation in relations:
             self._relations[relation.id] = relation
 
+        if not self.persist:
+            return
+
         # Batch write to JSONL file
         file_created = not self.relations_path.exists()
         with open(self.relations_path, "a", buffering=8192) as f:
@@ -738,22 +762,14 @@ class JSONLStorage:
         Returns:
             KnowledgeGraph with memories, relations, and statistics
         """
-        from ..core.decay import calculate_score
+        from ..core.decay import calculate_scores
 
         memories = self.list_memories(status=status)
         relations = self.get_all_relations()
 
         # Calculate statistics
         now = int(time.time())
-        scores = [
-            calculate_score(
-                use_count=m.use_count,
-                last_used=m.last_used,
-                strength=m.strength,
-                now=now,
-            )
-            for m in memories
-        ]
+        scores = calculate_scores(memories, now=now)
 
         stats = {
             "total_memories": len(memories),
@@ -791,6 +807,12 @@ class JSONLStorage:
             "relations_after": len(self._relations),
         }
 
+        if not self.persist:
+            # Nothing on disk to rewrite; the in-memory indexes are already compact
+            self._deleted_memory_ids.clear()
+            self._deleted_relation_ids.clear()
+            return stats
+
         # Count lines before compaction
         if self.memories_path.exists():
             with open(self.memories_path) as f:
@@ -853,6 +875,9 @@ class JSONLStorage:
 
     async def _append_memory_async(self, memory: Memory) -> None:
         """Async append memory to JSONL file."""
+        if not self.persist:
+            return
+
         file_created = not self.memories_path.exists()
 
         # Use asyncio for file I/O
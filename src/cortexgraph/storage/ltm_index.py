@@ -4,8 +4,15 @@ Index markdown files in the vault for fast search without scanning every file.
 """
 
 import json
+import multiprocessing
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +20,9 @@ import frontmatter
 
 from ..config import get_config
 
+_WIKILINK_PATTERN = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+_HASHTAG_PATTERN = re.compile(r"#([a-zA-Z0-9_/-]+)")
+
 
 class LTMDocument:
     """A document in the LTM index."""
@@ -65,14 +75,128 @@ class LTMDocument:
         )
 
 
+# Parsed index files keyed by path, with the (mtime_ns, size) they were read at,
+# least recently used first. A rewrite that keeps the same size within the
+# filesystem's mtime resolution (up to 2s on FAT, 1s on some network mounts)
+# is not detected until the file changes again.
+_LOADED_INDEXES: OrderedDict[
+    Path, tuple[tuple[int, int], dict[str, Any], dict[str, LTMDocument]]
+] = OrderedDict()
+
+# Number of parsed index files kept in _LOADED_INDEXES
+_LOADED_INDEX_LIMIT = 2
+
+# Guards _LOADED_INDEXES; searches may load indexes from executor threads
+_LOADED_INDEXES_LOCK = threading.Lock()
+
+
+def _get_loaded_index(
+    index_path: Path, file_key: tuple[int, int]
+) -> tuple[dict[str, Any], dict[str, LTMDocument]] | None:
+    """Return cached (stats, documents) for an index file if its key still matches."""
+    with _LOADED_INDEXES_LOCK:
+        cached = _LOADED_INDEXES.get(index_path)
+        if cached is None or cached[0] != file_key:
+            return None
+        _LOADED_INDEXES.move_to_end(index_path)
+        return cached[1], cached[2]
+
+
+def _store_loaded_index(
+    index_path: Path,
+    file_key: tuple[int, int],
+    stats: dict[str, Any],
+    documents: dict[str, LTMDocument],
+) -> None:
+    """Cache the parsed contents of an index file, evicting the least recently used."""
+    with _LOADED_INDEXES_LOCK:
+        _LOADED_INDEXES[index_path] = (file_key, stats, documents)
+        _LOADED_INDEXES.move_to_end(index_path)
+        while len(_LOADED_INDEXES) > _LOADED_INDEX_LIMIT:
+            _LOADED_INDEXES.popitem(last=False)
+
+
+def _parse_note(file_path: Path, vault_path: Path) -> LTMDocument | None:
+    """
+    Parse a markdown file into an LTMDocument.
+
+    Module-level so it can run in worker processes during build_index.
+
+    Args:
+        file_path: Path to markdown file
+        vault_path: Vault root used to compute the document's relative path
+
+    Returns:
+        LTMDocument or None if parsing fails
+    """
+    try:
+        # Read file with frontmatter parsing
+        with open(file_path, encoding="utf-8") as f:
+            post = frontmatter.load(f)
+
+        # Extract title (from frontmatter or filename)
+        title_raw = post.get("title", file_path.stem)
+        title = str(title_raw) if title_raw else file_path.stem
+
+        # Extract tags from frontmatter
+        fm_tags_raw = post.get("tags", [])
+        if isinstance(fm_tags_raw, str):
+            fm_tags: list[str] = [fm_tags_raw]
+        elif isinstance(fm_tags_raw, list):
+            fm_tags = fm_tags_raw
+        else:
+            fm_tags = []
+
+        # Extract wikilinks and hashtags from content
+        wikilinks = list(set(_WIKILINK_PATTERN.findall(post.content)))
+        content_tags = list(set(_HASHTAG_PATTERN.findall(post.content)))
+
+        # Combine tags
+        all_tags = list(set(fm_tags + content_tags))
+
+        # Get file stats
+        stat = file_path.stat()
+
+        # Create relative path from vault root (use POSIX style for cross-platform consistency)
+        rel_path = file_path.relative_to(vault_path).as_posix()
+
+        return LTMDocument(
+            path=rel_path,
+            title=title,
+            content=post.content,
+            frontmatter=dict(post.metadata),
+            wikilinks=wikilinks,
+            tags=all_tags,
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+        )
+
+    except Exception as e:
+        # Log error but don't fail entire index
+        print(f"Warning: Failed to parse {file_path}: {e}")
+        return None
+
+
+def _parse_notes(vault_path: Path, file_paths: list[Path]) -> list[LTMDocument | None]:
+    """Parse a chunk of markdown files; the unit of work for a worker process."""
+    return [_parse_note(file_path, vault_path) for file_path in file_paths]
+
+
 class LTMIndex:
     """Index of Long-Term Memory documents in Obsidian vault."""
 
     # Pattern for extracting wikilinks: [[link]] or [[link|alias]]
-    WIKILINK_PATTERN = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]+)?\]\]")
+    WIKILINK_PATTERN = _WIKILINK_PATTERN
 
     # Pattern for extracting hashtags: #tag
-    HASHTAG_PATTERN = re.compile(r"#([a-zA-Z0-9_/-]+)")
+    HASHTAG_PATTERN = _HASHTAG_PATTERN
+
+    # With parallel=True, batches smaller than this are still parsed serially,
+    # since spawning workers costs more than it saves on small vaults
+    PARALLEL_PARSE_THRESHOLD = 500
+
+    # Number of files handed to a worker process per task
+    PARSE_CHUNK_SIZE = 32
 
     def __init__(self, vault_path: Path, index_path: Path | None = None):
         """
@@ -101,6 +225,10 @@ class LTMIndex:
         # In-memory index
         self._documents: dict[str, LTMDocument] = {}
 
+        # Link lookups derived from _documents, rebuilt lazily after changes
+        self._title_to_path: dict[str, str] | None = None
+        self._backlinks: dict[str, list[str]] | None = None
+
         # Statistics
         self.stats = {
             "total_documents": 0,
@@ -145,62 +273,18 @@ class LTMIndex:
         Returns:
             LTMDocument or None if parsing fails
         """
-        try:
-            # Read file with frontmatter parsing
-            with open(file_path, encoding="utf-8") as f:
-                post = frontmatter.load(f)
-
-            # Extract title (from frontmatter or filename)
-            title_raw = post.get("title", file_path.stem)
-            title = str(title_raw) if title_raw else file_path.stem
-
-            # Extract tags from frontmatter
-            fm_tags_raw = post.get("tags", [])
-            if isinstance(fm_tags_raw, str):
-                fm_tags: list[str] = [fm_tags_raw]
-            elif isinstance(fm_tags_raw, list):
-                fm_tags = fm_tags_raw
-            else:
-                fm_tags = []
-
-            # Extract hashtags from content
-            content_tags = self.extract_hashtags(post.content)
-
-            # Combine tags
-            all_tags = list(set(fm_tags + content_tags))
-
-            # Extract wikilinks
-            wikilinks = self.extract_wikilinks(post.content)
+        return _parse_note(file_path, self.vault_path)
 
-            # Get file stats
-            stat = file_path.stat()
-
-            # Create relative path from vault root (use POSIX style for cross-platform consistency)
-            rel_path = file_path.relative_to(self.vault_path).as_posix()
-
-            return LTMDocument(
-                path=rel_path,
-                title=title,
-                content=post.content,
-                frontmatter=dict(post.metadata),
-                wikilinks=wikilinks,
-                tags=all_tags,
-                mtime=stat.st_mtime,
-                size=stat.st_size,
-            )
-
-        except Exception as e:
-            # Log error but don't fail entire index
-            print(f"Warning: Failed to parse {file_path}: {e}")
-            return None
-
-    def build_index(self, force: bool = False, verbose: bool = False) -> None:
+    def build_index(
+        self, force: bool = False, verbose: bool = False, parallel: bool = False
+    ) -> None:
         """
         Build or update the index by scanning vault directory.
 
         Args:
             force: If True, rebuild entire index. If False, only update changed files.
             verbose: If True, print progress information
+            parallel: If True, parse large batches of files in spawned worker processes
         """
         start_time = time.time()
 
@@ -222,9 +306,9 @@ class LTMIndex:
         # Track which files we've seen (for detecting deletions)
         seen_paths: set[str] = set()
 
-        # Index each file
-        updated_count = 0
+        # Collect files that need (re)parsing
         skipped_count = 0
+        to_parse: list[Path] = []
 
         for file_path in markdown_files:
             rel_path = file_path.relative_to(self.vault_path).as_posix()
@@ -237,10 +321,13 @@ class LTMIndex:
                     skipped_count += 1
                     continue
 
-            # Parse and index file
-            doc = self.parse_markdown_file(file_path)
+            to_parse.append(file_path)
+
+        # Parse and index files
+        updated_count = 0
+        for doc in self._parse_files(to_parse, parallel=parallel):
             if doc:
-                self._documents[rel_path] = doc
+                self._documents[doc.path] = doc
                 updated_count += 1
 
                 if verbose and updated_count % 100 == 0:
@@ -253,6 +340,8 @@ class LTMIndex:
                 del self._documents[path]
                 deleted_count += 1
 
+        self._invalidate_link_index()
+
         # Update statistics
         self.stats = {
             "total_documents": len(self._documents),
@@ -272,6 +361,37 @@ class LTMIndex:
         # Save index
         self.save_index()
 
+    def _parse_files(
+        self, file_paths: list[Path], parallel: bool = False
+    ) -> Iterator[LTMDocument | None]:
+        """
+        Parse markdown files, optionally fanning out to worker processes.
+
+        Workers are only used when parallel is requested, the batch reaches
+        PARALLEL_PARSE_THRESHOLD and more than one CPU is available. They are
+        started with the "spawn" method, so this is safe to call from a thread.
+
+        Args:
+            file_paths: Markdown files to parse
+            parallel: If True, allow parsing in worker processes
+
+        Returns:
+            Iterator of parsed documents (None for files that failed), in input order
+        """
+        chunks = [
+            file_paths[i : i + self.PARSE_CHUNK_SIZE]
+            for i in range(0, len(file_paths), self.PARSE_CHUNK_SIZE)
+        ]
+        max_workers = min(len(chunks), os.cpu_count() or 1)
+        if not parallel or len(file_paths) < self.PARALLEL_PARSE_THRESHOLD or max_workers <= 1:
+            return (self.parse_markdown_file(file_path) for file_path in file_paths)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            results = list(pool.map(_parse_notes, repeat(self.vault_path), chunks))
+        return chain.from_iterable(results)
+
     def save_index(self) -> None:
         """Save index to JSONL file."""
         with open(self.index_path, "w") as f:
@@ -282,11 +402,28 @@ class LTMIndex:
             for doc in self._documents.values():
                 f.write(json.dumps(doc.to_dict()) + "\n")
 
+        self._remember_loaded_index()
+
     def load_index(self) -> None:
-        """Load index from JSONL file."""
+        """
+        Load index from JSONL file.
+
+        Reuses the documents loaded or saved earlier in this process when the
+        file's mtime and size are unchanged, skipping the JSON parse. Only the
+        most recently used index files are kept (see _LOADED_INDEX_LIMIT).
+        """
         if not self.index_path.exists():
             return
 
+        self._invalidate_link_index()
+
+        cached = _get_loaded_index(self.index_path, self._index_file_key())
+        if cached is not None:
+            stats, documents = cached
+            self.stats = dict(stats)
+            self._documents = dict(documents)
+            return
+
         self._documents.clear()
 
         with open(self.index_path) as f:
@@ -304,6 +441,19 @@ class LTMIndex:
                     doc = LTMDocument.from_dict(data)
                     self._documents[doc.path] = doc
 
+        self._remember_loaded_index()
+
+    def _index_file_key(self) -> tuple[int, int]:
+        """Return (mtime_ns, size) of the index file, used to detect changes."""
+        stat = self.index_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _remember_loaded_index(self) -> None:
+        """Record the current documents as the parsed contents of the index file."""
+        _store_loaded_index(
+            self.index_path, self._index_file_key(), dict(self.stats), dict(self._documents)
+        )
+
     def search(
         self,
         query: str | None = None,
@@ -340,7 +490,7 @@ class LTMIndex:
         if query:
 
             def score_doc(doc: LTMDocument) -> tuple[int, int]:
-                title_match = 1 if query.lower() in doc.title.lower() else 0
+                title_match = 1 if query_lower in doc.title.lower() else 0
                 return (title_match, -len(doc.content))  # Negative for descending
 
             results.sort(key=score_doc, reverse=True)
@@ -381,7 +531,8 @@ class LTMIndex:
         Returns:
             List of documents containing wikilinks to this title
         """
-        return [doc for doc in self._documents.values() if title in doc.wikilinks]
+        backlinks = self._ensure_link_index_current()[1]
+        return [self._documents[path] for path in backlinks.get(title, [])]
 
     def get_forward_links(self, path: str) -> list[LTMDocument]:
         """
@@ -397,16 +548,37 @@ class LTMIndex:
         if not doc:
             return []
 
-        # Find documents by wikilink
-        linked_docs = []
-        for wikilink in doc.wikilinks:
-            # Try to find document by title
-            for candidate in self._documents.values():
-                if candidate.title == wikilink:
-                    linked_docs.append(candidate)
-                    break
+        # Resolve each wikilink to a document by title
+        title_to_path = self._ensure_link_index_current()[0]
+        return [
+            self._documents[title_to_path[wikilink]]
+            for wikilink in doc.wikilinks
+            if wikilink in title_to_path
+        ]
 
-        return linked_docs
+    def _invalidate_link_index(self) -> None:
+        """Drop the title and backlink lookups after documents change."""
+        self._title_to_path = None
+        self._backlinks = None
+
+    def _ensure_link_index_current(self) -> tuple[dict[str, str], dict[str, list[str]]]:
+        """
+        Build the title and backlink lookups if documents changed since last use.
+
+        Returns:
+            Tuple of (title -> path of the first document with that title,
+            wikilink target -> paths of documents linking to it)
+        """
+        if self._title_to_path is None or self._backlinks is None:
+            title_to_path: dict[str, str] = {}
+            backlinks: dict[str, list[str]] = {}
+            for path, doc in self._documents.items():
+                title_to_path.setdefault(doc.title, path)
+                for target in dict.fromkeys(doc.wikilinks):
+                    backlinks.setdefault(target, []).append(path)
+            self._title_to_path = title_to_path
+            self._backlinks = backlinks
+        return self._title_to_path, self._backlinks
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -441,6 +613,7 @@ class LTMIndex:
 
         # Add to index
         self._documents[doc.path] = doc
+        self._invalidate_link_index()
 
         # Update statistics
         self.stats["total_documents"] = len(self._documents)
@@ -474,6 +647,11 @@ def main() -> int:
         action="store_true",
         help="Force rebuild of entire index",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Parse files in worker processes (helps only on very large vaults)",
+    )
     parser.add_argument(
         "--search",
         type=str,
@@ -490,7 +668,7 @@ def main() -> int:
     try:
         # Build index
         index = LTMIndex(vault_path=args.vault_path, index_path=args.index_path)
-        index.build_index(force=args.force, verbose=True)
+        index.build_index(force=args.force, verbose=True, parallel=args.parallel)
 
         # Search if requested
         if args.search or args.tag:
@@ -498,21 +498,13 @@ class SQLiteStorage:
         self, status: MemoryStatus | None = MemoryStatus.ACTIVE
     ) -> KnowledgeGraph:
         """Get complete knowledge graph."""
-        from ..core.decay import calculate_score
+        from ..core.decay import calculate_scores
 
         memories = self.list_memories(status=status)
         relations = self.get_all_relations()
 
         now = int(time.time())
-        scores = [
-            calculate_score(
-                use_count=m.use_count,
-                last_used=m.last_used,
-                strength=m.strength,
-                now=now,
-            )
-            for m in memories
-        ]
+        scores = calculate_scores(memories, now=now)
 
         stats = {
             "total_memories": len(memories),
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from ..config import get_config
 from ..context import db, mcp
-from ..core.decay import calculate_score
+from ..core.decay import calculate_score, calculate_scores
 from ..core.pagination import paginate_list, validate_pagination_params
 from ..core.review import blend_search_results, get_memories_due_for_review
 from ..core.search_common import is_pagination_requested, validate_search_params
@@ -133,14 +133,7 @@ def search_memory(
             query_embed = _generate_query_embedding(params.query)
 
     results: list[SearchResult] = []
-    for memory in memories:
-        score = calculate_score(
-            use_count=memory.use_count,
-            last_used=memory.last_used,
-            strength=memory.strength,
-            now=now,
-        )
-
+    for memory, score in zip(memories, calculate_scores(memories, now=now), strict=True):
         if params.min_score is not None and score < params.min_score:
             continue
 
@@ -1,11 +1,12 @@
 """Unified search across STM and LTM."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..config import get_config
 from ..context import db, mcp
-from ..core.decay import calculate_score
+from ..core.decay import calculate_scores
 from ..core.pagination import paginate_list, validate_pagination_params
 from ..core.search_common import is_pagination_requested, validate_search_params
 from ..core.text_utils import truncate_content
@@ -39,13 +40,8 @@ def _search_stm(
             stm_memories = [m for m in stm_memories if params.query.lower() in m.content.lower()]
 
         now = int(time.time())
-        for memory in stm_memories:
-            score = calculate_score(
-                use_count=memory.use_count,
-                last_used=memory.last_used,
-                strength=memory.strength,
-                now=now,
-            )
+        scores = calculate_scores(stm_memories, now=now)
+        for memory, score in zip(stm_memories, scores, strict=True):
             if params.min_score is not None and score < params.min_score:
                 continue
 
@@ -132,30 +128,46 @@ def _search_ltm(
     return results
 
 
-def _deduplicate_results(
-    results: list["UnifiedSearchResult"],
-    limit: int,
+# Rank offset for Reciprocal Rank Fusion (Cormack et al., 2009)
+RRF_K = 60
+
+
+def _dedup_key(result: "UnifiedSearchResult") -> str:
+    """Key under which two results are considered the same item."""
+    return result.content[:100].lower().strip()
+
+
+def _fuse_rankings(
+    ranked_sources: list[tuple[list["UnifiedSearchResult"], float]],
 ) -> list["UnifiedSearchResult"]:
-    """Remove duplicate results based on content prefix.
+    """Merge per-source result lists with weighted Reciprocal Rank Fusion.
+
+    STM decay scores and LTM relevance scores are on different scales, so
+    each list is ranked by its own score and an item earns
+    ``weight / (RRF_K + rank)`` from every list it appears in. Items with the
+    same content prefix are fused into one result, keeping the one with the
+    higher raw score for display.
 
     Args:
-        results: List of search results (assumed sorted by score)
-        limit: Maximum number of results to keep
+        ranked_sources: (results, weight) pairs, one per source
 
     Returns:
-        Deduplicated list of results
+        Fused results ordered by ``rrf_score`` (raw score breaks ties)
     """
-    seen_content = set()
-    deduplicated: list[UnifiedSearchResult] = []
-    for result in results:
-        dedup_key = result.content[:100].lower().strip()
-        if dedup_key not in seen_content:
-            seen_content.add(dedup_key)
-            deduplicated.append(result)
-            if len(deduplicated) >= limit:
-                break
-
-    return deduplicated
+    fused: dict[str, UnifiedSearchResult] = {}
+    rrf_scores: dict[str, float] = {}
+    for results, weight in ranked_sources:
+        ranked = sorted(results, key=lambda r: r.score, reverse=True)
+        for rank, result in enumerate(ranked, start=1):
+            key = _dedup_key(result)
+            rrf_scores[key] = rrf_scores.get(key, 0.0) + weight / (RRF_K + rank)
+            current = fused.get(key)
+            if current is None or result.score > current.score:
+                fused[key] = result
+
+    for key, result in fused.items():
+        result.rrf_score = rrf_scores[key]
+    return sorted(fused.values(), key=lambda r: (r.rrf_score or 0.0, r.score), reverse=True)
 
 
 class UnifiedSearchResult:
@@ -172,6 +184,7 @@ class UnifiedSearchResult:
         tags: list[str] | None = None,
         created_at: int | None = None,
         last_used: int | None = None,
+        rrf_score: float | None = None,
     ):
         self.content = content
         self.title = title
@@ -182,6 +195,7 @@ class UnifiedSearchResult:
         self.tags = tags or []
         self.created_at = created_at
         self.last_used = last_used
+        self.rrf_score = rrf_score
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -195,6 +209,7 @@ class UnifiedSearchResult:
             "tags": self.tags,
             "created_at": self.created_at,
             "last_used": self.last_used,
+            "rrf_score": self.rrf_score,
         }
 
 
@@ -213,7 +228,7 @@ def search_unified(
     page_size: int | None = None,
     preview_length: int | None = None,
 ) -> dict[str, Any]:
-    """Search across STM and LTM with unified ranking.
+    """Search across STM and LTM, merging rankings with Reciprocal Rank Fusion.
 
     Args:
         query: Search text (max 50k chars).
@@ -257,22 +272,23 @@ def search_unified(
     # Check if pagination was explicitly requested
     pagination_requested = is_pagination_requested(page, page_size)
 
-    # Search both STM and LTM
-    stm_results = _search_stm(params, stm_weight)
-    ltm_results = _search_ltm(params, ltm_weight)
-
-    # Combine and sort by score
-    all_results = stm_results + ltm_results
-    all_results.sort(key=lambda r: r.score, reverse=True)
+    # Search LTM in the background, since it may rebuild its index from disk,
+    # while the in-memory STM search runs on the calling thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        ltm_future = pool.submit(_search_ltm, params, ltm_weight)
+        stm_results = _search_stm(params, stm_weight)
+        ltm_results = ltm_future.result()
 
-    # Deduplicate results
-    deduplicated = _deduplicate_results(all_results, params.limit)
+    # Fuse the per-source rankings; raw scores are not comparable across sources.
+    # Fusion also merges duplicates, so the top results are already unique.
+    fused = _fuse_rankings([(stm_results, stm_weight), (ltm_results, ltm_weight)])
+    top_results = fused[: params.limit]
 
     # Apply pagination only if requested
     if pagination_requested:
         # Validate and get non-None values
         valid_page, valid_page_size = validate_pagination_params(page, page_size)
-        paginated = paginate_list(deduplicated, page=valid_page, page_size=valid_page_size)
+        paginated = paginate_list(top_results, page=valid_page, page_size=valid_page_size)
         return {
             "success": True,
             "count": len(paginated.items),
@@ -283,8 +299,8 @@ def search_unified(
         # No pagination - return all results
         return {
             "success": True,
-            "count": len(deduplicated),
-            "results": [r.to_dict() for r in deduplicated],
+            "count": len(top_results),
+            "results": [r.to_dict() for r in top_results],
         }
 
 
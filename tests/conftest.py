@@ -134,6 +134,9 @@ def requires_beads():
 def pytest_configure(config):
     """Register custom pytest markers."""
     config.addinivalue_line("markers", "requires_beads: mark test as requiring beads CLI (bd)")
+    config.addinivalue_line(
+        "markers", "integration: end-to-end test against real (temporary) storage"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
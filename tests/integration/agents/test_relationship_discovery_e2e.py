@@ -2,115 +2,192 @@
 
 These tests verify the full workflow of RelationshipDiscovery
 with real storage and relation creation.
+
+The corpus template is loaded once per module under ``tmp_path_factory``.
+Most tests get their own ``tmp_path`` storage holding deep copies of it.
+``TestRelationshipDiscoveryEndToEnd`` instead shares one class-scoped,
+in-memory storage (``populated_storage_shared``, ``persist=False``); its
+autouse fixture restores only ``storage.relations`` after each test, so
+tests in that class must not modify memories. Under xdist the class stays
+on one worker with ``--dist loadscope``, and each worker builds its own
+copy, so no files are shared between workers.
 """
 
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+from cortexgraph.config import get_config
 from cortexgraph.storage.jsonl_storage import JSONLStorage
 from cortexgraph.storage.models import Memory, MemoryMetadata, MemoryStatus, Relation
 
-if TYPE_CHECKING:
-    pass
+pytestmark = [pytest.mark.integration]
 
 
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
+_NOW = int(time.time())
 
-@pytest.fixture
-def temp_storage(tmp_path: Path):
-    """Create a temporary JSONL storage for testing."""
-    storage_path = tmp_path / "test_storage"
-    storage_path.mkdir(parents=True, exist_ok=True)
-    storage = JSONLStorage(storage_path=str(storage_path))
-    storage.connect()
-    yield storage
-    # JSONLStorage doesn't have disconnect(), just yield and let cleanup happen
-
-
-@pytest.fixture
-def populated_storage(temp_storage: JSONLStorage):
-    """Create storage with memories that have shared entities."""
-    now = int(time.time())
-
+# Corpus for populated_storage. It exercises relation discovery, not Memory
+# validation, so it is built once at import with ``model_construct`` and
+# pre-serialized to JSONL; the fixture only has to write the bytes to disk.
+_TEMPLATE_MEMORIES = [
     # Memory pair with shared entities (PostgreSQL, Database)
-    mem1 = Memory(
+    Memory.model_construct(
         id="mem-pg-config",
         content="PostgreSQL database configuration for production deployment",
         entities=["PostgreSQL", "Database", "Production"],
-        meta=MemoryMetadata(tags=["database", "config", "devops"]),
+        meta=MemoryMetadata.model_construct(tags=["database", "config", "devops"]),
         strength=1.2,
         use_count=5,
-        created_at=now - 86400 * 3,
-        last_used=now - 3600,
+        created_at=_NOW - 86400 * 3,
+        last_used=_NOW - 3600,
         status=MemoryStatus.ACTIVE,
-    )
-
-    mem2 = Memory(
+    ),
+    Memory.model_construct(
         id="mem-pg-perf",
         content="PostgreSQL database performance tuning guide",
         entities=["PostgreSQL", "Database", "Performance"],
-        meta=MemoryMetadata(tags=["database", "optimization", "performance"]),
+        meta=MemoryMetadata.model_construct(tags=["database", "optimization", "performance"]),
         strength=1.1,
         use_count=3,
-        created_at=now - 86400 * 5,
-        last_used=now - 7200,
+        created_at=_NOW - 86400 * 5,
+        last_used=_NOW - 7200,
         status=MemoryStatus.ACTIVE,
-    )
-
+    ),
     # Another pair with shared entities (React, Frontend)
-    mem3 = Memory(
+    Memory.model_construct(
         id="mem-react-hooks",
         content="React hooks best practices and patterns",
         entities=["React", "Hooks", "Frontend"],
-        meta=MemoryMetadata(tags=["javascript", "react", "patterns"]),
+        meta=MemoryMetadata.model_construct(tags=["javascript", "react", "patterns"]),
         strength=1.0,
         use_count=4,
-        created_at=now - 86400 * 2,
-        last_used=now - 1800,
+        created_at=_NOW - 86400 * 2,
+        last_used=_NOW - 1800,
         status=MemoryStatus.ACTIVE,
-    )
-
-    mem4 = Memory(
+    ),
+    Memory.model_construct(
         id="mem-react-state",
         content="React state management with hooks and context",
         entities=["React", "State", "Frontend"],
-        meta=MemoryMetadata(tags=["javascript", "react", "state"]),
+        meta=MemoryMetadata.model_construct(tags=["javascript", "react", "state"]),
         strength=1.0,
         use_count=2,
-        created_at=now - 86400 * 4,
-        last_used=now - 5400,
+        created_at=_NOW - 86400 * 4,
+        last_used=_NOW - 5400,
         status=MemoryStatus.ACTIVE,
-    )
-
+    ),
     # Isolated memory (no shared entities with others)
-    mem5 = Memory(
+    Memory.model_construct(
         id="mem-docker",
         content="Docker containerization basics",
         entities=["Docker", "Containers", "DevOps"],
-        meta=MemoryMetadata(tags=["devops", "docker", "infrastructure"]),
+        meta=MemoryMetadata.model_construct(tags=["devops", "docker", "infrastructure"]),
         strength=1.0,
         use_count=1,
-        created_at=now - 86400,
-        last_used=now - 900,
+        created_at=_NOW - 86400,
+        last_used=_NOW - 900,
         status=MemoryStatus.ACTIVE,
-    )
+    ),
+]
+
+_TEMPLATE_BYTES = "".join(m.model_dump_json() + "\n" for m in _TEMPLATE_MEMORIES).encode()
+
+# Validated once at import; edge-case tests derive their memories from it
+# with ``model_copy``, which skips re-validation.
+_EDGE_PROTOTYPE = Memory(
+    id="prototype",
+    content="prototype",
+    strength=1.0,
+    use_count=1,
+    created_at=_NOW,
+    last_used=_NOW,
+    status=MemoryStatus.ACTIVE,
+)
+
+
+@pytest.fixture
+def temp_storage(tmp_path: Path):
+    """Create a temporary JSONL storage for testing."""
+    storage_path = tmp_path / "test_storage"
+    storage_path.mkdir(parents=True, exist_ok=True)
+    storage = JSONLStorage(storage_path=str(storage_path))
+    storage.connect()
+    yield storage
+    # JSONLStorage doesn't have disconnect(), just yield and let cleanup happen
+
+
+@pytest.fixture(scope="module")
+def populated_template(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Memory]:
+    """Load the populated corpus from JSONL once per module (and xdist worker)."""
+    storage_path = tmp_path_factory.mktemp("populated_template")
+    (storage_path / get_config().stm_memories_filename).write_bytes(_TEMPLATE_BYTES)
+    storage = JSONLStorage(storage_path=str(storage_path))
+    storage.connect()
+    return storage.memories
 
-    # Add all memories
-    for mem in [mem1, mem2, mem3, mem4, mem5]:
-        temp_storage.save_memory(mem)
 
+@pytest.fixture(scope="module")
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Thread pool shared by the batch-processing tests in this module."""
+    with ThreadPoolExecutor() as pool:
+        yield pool
+
+
+@pytest.fixture
+def populated_storage(
+    temp_storage: JSONLStorage, populated_template: dict[str, Memory]
+) -> JSONLStorage:
+    """Create storage with memories that have shared entities.
+
+    Each test gets deep copies of the module template, so relations and
+    memory edits made by one test never leak into another.
+    """
+    temp_storage.memories = {
+        mid: memory.model_copy(deep=True) for mid, memory in populated_template.items()
+    }
     return temp_storage
 
 
+@pytest.fixture(scope="class")
+def populated_storage_shared(
+    tmp_path_factory: pytest.TempPathFactory, populated_template: dict[str, Memory]
+) -> JSONLStorage:
+    """In-memory populated storage shared by every test in a class.
+
+    Tests only add relations to it, which the class restores after each
+    test; memories are never modified.
+    """
+    storage = JSONLStorage(storage_path=tmp_path_factory.mktemp("shared"), persist=False)
+    storage.connect()
+    storage.memories = {
+        mid: memory.model_copy(deep=True) for mid, memory in populated_template.items()
+    }
+    return storage
+
+
+_MOCK_ISSUE_ID = "mock-issue-123"
+
+
+def _mock_create_issue(*args: object, **kwargs: object) -> str:
+    """Stand-in for create_consolidation_issue; live-mode tests inject it."""
+    return _MOCK_ISSUE_ID
+
+
+def _mock_close_issue(*args: object, **kwargs: object) -> None:
+    """Stand-in for close_issue; live-mode tests inject it."""
+
+
 # =============================================================================
 # T073: Integration Tests - Relation Creation with Reasoning
 # =============================================================================
@@ -119,165 +196,131 @@ def populated_storage(temp_storage: JSONLStorage):
 class TestRelationshipDiscoveryEndToEnd:
     """End-to-end integration tests for RelationshipDiscovery."""
 
-    def test_full_discovery_workflow_dry_run(self, populated_storage: JSONLStorage) -> None:
+    @pytest.fixture(autouse=True)
+    def restore_relations(self, populated_storage_shared: JSONLStorage) -> Iterator[None]:
+        """Drop relations a test creates so the shared storage stays pristine."""
+        snapshot = dict(populated_storage_shared.relations)
+        yield
+        populated_storage_shared.relations = snapshot
+
+    def test_full_discovery_workflow_dry_run(
+        self, populated_storage_shared: JSONLStorage, executor: ThreadPoolExecutor
+    ) -> None:
         """Full workflow: scan, process, verify - in dry run mode."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=2)
-            discovery._storage = populated_storage
-
-            # Step 1: Scan for candidates
-            candidates = discovery.scan()
-
-            # Should find pairs with 2+ shared entities
-            assert len(candidates) >= 1
-
-            # Step 2: Process each candidate
-            results = []
-            for pair_id in candidates:
-                result = discovery.process_item(pair_id)
-                results.append(result)
-
-            # Step 3: Verify results
-            for result in results:
-                assert result.strength >= 0.0
-                assert result.strength <= 1.0
-                assert result.confidence >= 0.0
-                assert result.confidence <= 1.0
-                assert len(result.reasoning) > 0
-                assert len(result.shared_entities) >= 2
-
-            # Dry run should NOT create relations
-            relations_after = populated_storage.get_relations()
-            assert len(relations_after) == 0
-
-    def test_full_discovery_workflow_live_mode(self, populated_storage: JSONLStorage) -> None:
+        discovery = RelationshipDiscovery(
+            storage=populated_storage_shared, dry_run=True, min_shared_entities=2
+        )
+
+        # Step 1: Scan for candidates
+        candidates = discovery.scan()
+
+        # Should find pairs with 2+ shared entities
+        assert len(candidates) >= 1
+
+        # Step 2: Process all candidates as one batch
+        results = discovery.process_batch(candidates, executor=executor)
+        assert len(results) == len(candidates)
+
+        # Step 3: Verify results
+        for result in results:
+            assert result.strength >= 0.0
+            assert result.strength <= 1.0
+            assert result.confidence >= 0.0
+            assert result.confidence <= 1.0
+            assert len(result.reasoning) > 0
+            assert len(result.shared_entities) >= 2
+
+        # Dry run should NOT create relations
+        relations_after = populated_storage_shared.get_relations()
+        assert len(relations_after) == 0
+
+    def test_full_discovery_workflow_live_mode(
+        self, populated_storage_shared: JSONLStorage, executor: ThreadPoolExecutor
+    ) -> None:
         """Full workflow with actual relation creation."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        discovery = RelationshipDiscovery(
+            storage=populated_storage_shared,
+            create_issue=_mock_create_issue,
+            close_issue=_mock_close_issue,
+            dry_run=False,
+            min_shared_entities=2,
+            min_confidence=0.3,
+        )
 
-        # Patch beads integration to avoid actual beads calls
-        with (
-            patch(
-                "cortexgraph.agents.relationship_discovery.get_storage",
-                return_value=populated_storage,
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.create_consolidation_issue",
-                return_value="mock-issue-123",
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.close_issue",
-                return_value=None,
-            ),
-        ):
-            discovery = RelationshipDiscovery(
-                dry_run=False, min_shared_entities=2, min_confidence=0.3
-            )
-            discovery._storage = populated_storage
-
-            # Step 1: Scan
-            candidates = discovery.scan()
-            assert len(candidates) >= 1
-
-            # Step 2: Process (creates relations)
-            created_relations = []
-            for pair_id in candidates:
-                result = discovery.process_item(pair_id)
-                if result.beads_issue_id:  # Was actually created
-                    created_relations.append(result)
-
-            # Step 3: Verify relations were created
-            relations_after = populated_storage.get_relations()
-            assert len(relations_after) >= len(created_relations)
-
-            # Verify relation metadata
-            for rel in relations_after:
-                assert rel.relation_type == "related"
-                assert "discovered_by" in rel.metadata
-                assert rel.metadata["discovered_by"] == "RelationshipDiscovery"
-                assert "shared_entities" in rel.metadata
-                assert "confidence" in rel.metadata
-                assert "reasoning" in rel.metadata
-
-    def test_discovers_postgresql_pair(self, populated_storage: JSONLStorage) -> None:
-        """Discovers relation between PostgreSQL memories."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        # Step 1: Scan
+        candidates = discovery.scan()
+        assert len(candidates) >= 1
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=2)
-            discovery._storage = populated_storage
+        # Step 2: Process (creates relations)
+        results = discovery.process_batch(candidates, executor=executor)
+        created_relations = [r for r in results if r.beads_issue_id]  # Actually created
 
-            candidates = discovery.scan()
+        # Step 3: Verify relations were created
+        relations_after = populated_storage_shared.get_relations()
+        assert len(relations_after) >= len(created_relations)
 
-            # Find the PostgreSQL pair
-            pg_pair = None
-            for pair_id in candidates:
-                if "mem-pg-config" in pair_id and "mem-pg-perf" in pair_id:
-                    pg_pair = pair_id
-                    break
+        # Verify relation metadata
+        for rel in relations_after:
+            assert rel.relation_type == "related"
+            assert "discovered_by" in rel.metadata
+            assert rel.metadata["discovered_by"] == "RelationshipDiscovery"
+            assert "shared_entities" in rel.metadata
+            assert "confidence" in rel.metadata
+            assert "reasoning" in rel.metadata
 
-            assert pg_pair is not None, "PostgreSQL pair not found"
+    def test_discovers_postgresql_pair(self, populated_storage_shared: JSONLStorage) -> None:
+        """Discovers relation between PostgreSQL memories."""
+        discovery = RelationshipDiscovery(
+            storage=populated_storage_shared, dry_run=True, min_shared_entities=2
+        )
 
-            # Process and verify
-            result = discovery.process_item(pg_pair)
+        discovery.scan()
 
-            # Should have PostgreSQL and Database as shared entities
-            assert "PostgreSQL" in result.shared_entities
-            assert "Database" in result.shared_entities
-            assert result.reasoning  # Non-empty reasoning
+        # Find the PostgreSQL pair
+        pg_pair = discovery.candidate_pairs.get(frozenset({"mem-pg-config", "mem-pg-perf"}))
 
-    def test_discovers_react_pair(self, populated_storage: JSONLStorage) -> None:
-        """Discovers relation between React memories."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        assert pg_pair is not None, "PostgreSQL pair not found"
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=2)
-            discovery._storage = populated_storage
+        # Process and verify
+        result = discovery.process_item(pg_pair)
 
-            candidates = discovery.scan()
+        # Should have PostgreSQL and Database as shared entities
+        assert "PostgreSQL" in result.shared_entities
+        assert "Database" in result.shared_entities
+        assert result.reasoning  # Non-empty reasoning
 
-            # Find the React pair
-            react_pair = None
-            for pair_id in candidates:
-                if "mem-react-hooks" in pair_id and "mem-react-state" in pair_id:
-                    react_pair = pair_id
-                    break
+    def test_discovers_react_pair(self, populated_storage_shared: JSONLStorage) -> None:
+        """Discovers relation between React memories."""
+        discovery = RelationshipDiscovery(
+            storage=populated_storage_shared, dry_run=True, min_shared_entities=2
+        )
+
+        discovery.scan()
 
-            assert react_pair is not None, "React pair not found"
+        # Find the React pair
+        react_pair = discovery.candidate_pairs.get(
+            frozenset({"mem-react-hooks", "mem-react-state"})
+        )
 
-            # Process and verify
-            result = discovery.process_item(react_pair)
+        assert react_pair is not None, "React pair not found"
 
-            # Should have React and Frontend as shared entities
-            assert "React" in result.shared_entities
-            assert "Frontend" in result.shared_entities
+        # Process and verify
+        result = discovery.process_item(react_pair)
 
-    def test_excludes_isolated_memory(self, populated_storage: JSONLStorage) -> None:
-        """Isolated memory with no shared entities is not paired."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        # Should have React and Frontend as shared entities
+        assert "React" in result.shared_entities
+        assert "Frontend" in result.shared_entities
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=2)
-            discovery._storage = populated_storage
+    def test_excludes_isolated_memory(self, populated_storage_shared: JSONLStorage) -> None:
+        """Isolated memory with no shared entities is not paired."""
+        discovery = RelationshipDiscovery(
+            storage=populated_storage_shared, dry_run=True, min_shared_entities=2
+        )
 
-            candidates = discovery.scan()
+        discovery.scan()
 
-            # Docker memory should not appear in any pair (no shared entities with others)
-            for pair_id in candidates:
-                assert "mem-docker" not in pair_id
+        # Docker memory should not appear in any pair (no shared entities with others)
+        assert not any("mem-docker" in pair for pair in discovery.candidate_pairs)
 
 
 class TestRelationshipDiscoveryEdgeCases:
@@ -285,98 +328,63 @@ class TestRelationshipDiscoveryEdgeCases:
 
     def test_handles_empty_storage(self, temp_storage: JSONLStorage) -> None:
         """Handles storage with no memories."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=temp_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = temp_storage
+        discovery = RelationshipDiscovery(storage=temp_storage, dry_run=True)
 
-            candidates = discovery.scan()
+        candidates = discovery.scan()
 
-            assert candidates == []
+        assert candidates == []
 
     def test_handles_single_memory(self, temp_storage: JSONLStorage) -> None:
         """Handles storage with only one memory."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        now = int(time.time())
-        mem = Memory(
-            id="mem-solo",
-            content="Lonely memory",
-            entities=["Entity1"],
-            meta=MemoryMetadata(tags=["tag1"]),
-            strength=1.0,
-            use_count=1,
-            created_at=now,
-            last_used=now,
-            status=MemoryStatus.ACTIVE,
+        mem = _EDGE_PROTOTYPE.model_copy(
+            update={
+                "id": "mem-solo",
+                "content": "Lonely memory",
+                "entities": ["Entity1"],
+                "meta": MemoryMetadata.model_construct(tags=["tag1"]),
+            }
         )
         temp_storage.save_memory(mem)
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=temp_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = temp_storage
+        discovery = RelationshipDiscovery(storage=temp_storage, dry_run=True)
 
-            candidates = discovery.scan()
+        candidates = discovery.scan()
 
-            assert candidates == []
+        assert candidates == []
 
     def test_skips_archived_memories(self, temp_storage: JSONLStorage) -> None:
         """Does not include archived memories in pairs."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        now = int(time.time())
-
-        mem_active = Memory(
-            id="mem-active",
-            content="Active memory",
-            entities=["SharedEntity"],
-            meta=MemoryMetadata(tags=["tag1"]),
-            strength=1.0,
-            use_count=1,
-            created_at=now,
-            last_used=now,
-            status=MemoryStatus.ACTIVE,
+        mem_active = _EDGE_PROTOTYPE.model_copy(
+            update={
+                "id": "mem-active",
+                "content": "Active memory",
+                "entities": ["SharedEntity"],
+                "meta": MemoryMetadata.model_construct(tags=["tag1"]),
+            }
         )
 
-        mem_archived = Memory(
-            id="mem-archived",
-            content="Archived memory",
-            entities=["SharedEntity"],
-            meta=MemoryMetadata(tags=["tag2"]),
-            strength=1.0,
-            use_count=1,
-            created_at=now,
-            last_used=now,
-            status=MemoryStatus.ARCHIVED,
+        mem_archived = _EDGE_PROTOTYPE.model_copy(
+            update={
+                "id": "mem-archived",
+                "content": "Archived memory",
+                "entities": ["SharedEntity"],
+                "meta": MemoryMetadata.model_construct(tags=["tag2"]),
+                "status": MemoryStatus.ARCHIVED,
+            }
         )
 
         temp_storage.save_memory(mem_active)
         temp_storage.save_memory(mem_archived)
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=temp_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=1)
-            discovery._storage = temp_storage
+        discovery = RelationshipDiscovery(storage=temp_storage, dry_run=True, min_shared_entities=1)
 
-            candidates = discovery.scan()
+        discovery.scan()
 
-            # Archived memory should not be paired
-            for pair_id in candidates:
-                assert "mem-archived" not in pair_id
+        # Archived memory should not be paired
+        assert not any("mem-archived" in pair for pair in discovery.candidate_pairs)
 
     def test_skips_already_related_pairs(self, populated_storage: JSONLStorage) -> None:
         """Does not suggest pairs that already have a relation."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         # Create an existing relation between PostgreSQL memories
         existing_relation = Relation(
             id="existing-rel-1",
@@ -388,22 +396,16 @@ class TestRelationshipDiscoveryEdgeCases:
         )
         populated_storage.create_relation(existing_relation)
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=2)
-            discovery._storage = populated_storage
+        discovery = RelationshipDiscovery(
+            storage=populated_storage, dry_run=True, min_shared_entities=2
+        )
 
-            candidates = discovery.scan()
+        discovery.scan()
 
-            # PostgreSQL pair should be excluded (already related)
-            for pair_id in candidates:
-                has_pg_config = "mem-pg-config" in pair_id
-                has_pg_perf = "mem-pg-perf" in pair_id
-                assert not (has_pg_config and has_pg_perf), (
-                    "Already-related pair should be excluded"
-                )
+        # PostgreSQL pair should be excluded (already related)
+        assert frozenset({"mem-pg-config", "mem-pg-perf"}) not in discovery.candidate_pairs, (
+            "Already-related pair should be excluded"
+        )
 
 
 class TestRelationshipDiscoveryLiveMode:
@@ -411,97 +413,66 @@ class TestRelationshipDiscoveryLiveMode:
 
     def test_relation_metadata_complete(self, populated_storage: JSONLStorage) -> None:
         """Created relations have complete metadata."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        with (
-            patch(
-                "cortexgraph.agents.relationship_discovery.get_storage",
-                return_value=populated_storage,
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.create_consolidation_issue",
-                return_value="mock-issue-456",
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.close_issue",
-                return_value=None,
-            ),
-        ):
-            discovery = RelationshipDiscovery(
-                dry_run=False, min_shared_entities=2, min_confidence=0.3
-            )
-            discovery._storage = populated_storage
+        discovery = RelationshipDiscovery(
+            storage=populated_storage,
+            create_issue=_mock_create_issue,
+            close_issue=_mock_close_issue,
+            dry_run=False,
+            min_shared_entities=2,
+            min_confidence=0.3,
+        )
 
-            candidates = discovery.scan()
-            assert len(candidates) >= 1
+        candidates = discovery.scan()
+        assert len(candidates) >= 1
 
-            # Process first candidate
-            discovery.process_item(candidates[0])
+        # Process first candidate
+        discovery.process_item(candidates[0])
 
-            # Verify relation was created with complete metadata
-            relations = populated_storage.get_relations()
-            assert len(relations) >= 1
+        # Verify relation was created with complete metadata
+        relations = populated_storage.get_relations()
+        assert len(relations) >= 1
 
-            rel = relations[0]
-            assert rel.metadata["discovered_by"] == "RelationshipDiscovery"
-            assert isinstance(rel.metadata["shared_entities"], list)
-            assert isinstance(rel.metadata["confidence"], float)
-            assert isinstance(rel.metadata["reasoning"], str)
-            assert rel.metadata["beads_issue_id"] == "mock-issue-456"
+        rel = relations[0]
+        assert rel.metadata["discovered_by"] == "RelationshipDiscovery"
+        assert isinstance(rel.metadata["shared_entities"], list)
+        assert isinstance(rel.metadata["confidence"], float)
+        assert isinstance(rel.metadata["reasoning"], str)
+        assert rel.metadata["beads_issue_id"] == _MOCK_ISSUE_ID
 
     def test_skips_low_confidence_relations(self, populated_storage: JSONLStorage) -> None:
         """Does not create relations below confidence threshold."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            # Set very high confidence threshold
-            discovery = RelationshipDiscovery(
-                dry_run=False, min_shared_entities=1, min_confidence=0.99
-            )
-            discovery._storage = populated_storage
-
-            candidates = discovery.scan()
-
-            # Process all candidates
-            for pair_id in candidates:
-                result = discovery.process_item(pair_id)
-                # Result should indicate skip due to confidence
-                if result.confidence < 0.99:
-                    assert result.beads_issue_id is None
-                    assert "Skipped" in result.reasoning
+        # Set very high confidence threshold
+        discovery = RelationshipDiscovery(
+            storage=populated_storage, dry_run=False, min_shared_entities=1, min_confidence=0.99
+        )
+
+        candidates = discovery.scan()
+
+        # Process all candidates
+        for pair_id in candidates:
+            result = discovery.process_item(pair_id)
+            # Result should indicate skip due to confidence
+            if result.confidence < 0.99:
+                assert result.beads_issue_id is None
+                assert "Skipped" in result.reasoning
 
     def test_result_includes_beads_issue_id(self, populated_storage: JSONLStorage) -> None:
         """Live mode results include beads issue ID."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        with (
-            patch(
-                "cortexgraph.agents.relationship_discovery.get_storage",
-                return_value=populated_storage,
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.create_consolidation_issue",
-                return_value="beads-test-789",
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.close_issue",
-                return_value=None,
-            ),
-        ):
-            discovery = RelationshipDiscovery(
-                dry_run=False, min_shared_entities=2, min_confidence=0.3
-            )
-            discovery._storage = populated_storage
+        discovery = RelationshipDiscovery(
+            storage=populated_storage,
+            create_issue=_mock_create_issue,
+            close_issue=_mock_close_issue,
+            dry_run=False,
+            min_shared_entities=2,
+            min_confidence=0.3,
+        )
 
-            candidates = discovery.scan()
-            assert len(candidates) >= 1
+        candidates = discovery.scan()
+        assert len(candidates) >= 1
 
-            result = discovery.process_item(candidates[0])
+        result = discovery.process_item(candidates[0])
 
-            assert result.beads_issue_id == "beads-test-789"
+        assert result.beads_issue_id == _MOCK_ISSUE_ID
 
 
 class TestRelationshipDiscoveryCoverageGaps:
@@ -509,94 +480,63 @@ class TestRelationshipDiscoveryCoverageGaps:
 
     def test_invalid_pair_id_no_colon(self, temp_storage: JSONLStorage) -> None:
         """ValueError when pair_id has no colon separator (covers lines 241, 245)."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        discovery = RelationshipDiscovery(storage=temp_storage, dry_run=True)
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=temp_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = temp_storage
-
-            with pytest.raises(ValueError, match="Invalid pair ID format"):
-                discovery.process_item("invalid-pair-id-no-colon")
+        with pytest.raises(ValueError, match="Invalid pair ID format"):
+            discovery.process_item("invalid-pair-id-no-colon")
 
     def test_process_item_not_in_cache_recalculates(self, populated_storage: JSONLStorage) -> None:
         """When pair not in cache, recalculates shared entities (covers lines 254-264)."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        discovery = RelationshipDiscovery(
+            storage=populated_storage, dry_run=True, min_shared_entities=1
+        )
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=1)
-            discovery._storage = populated_storage
+        # Process without scanning (cache will be empty)
+        pair_id = RelationshipDiscovery.make_pair_id("mem-pg-perf", "mem-pg-config")
+        assert pair_id == "mem-pg-config:mem-pg-perf"
 
-            # Process without scanning (cache will be empty)
-            # Manually construct a valid pair_id
-            pair_id = "mem-pg-config:mem-pg-perf"
+        # Cache should be empty
+        assert pair_id not in discovery._candidate_cache
 
-            # Cache should be empty
-            assert pair_id not in discovery._candidate_cache
+        # Process should still work by recalculating
+        result = discovery.process_item(pair_id)
 
-            # Process should still work by recalculating
-            result = discovery.process_item(pair_id)
-
-            assert result.strength >= 0.0
-            assert len(result.shared_entities) >= 1
+        assert result.strength >= 0.0
+        assert len(result.shared_entities) >= 1
 
     def test_process_item_memory_not_found(self, populated_storage: JSONLStorage) -> None:
         """ValueError when memory not found (covers lines 257-260)."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+        discovery = RelationshipDiscovery(storage=populated_storage, dry_run=True)
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=populated_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = populated_storage
-
-            # Pair with non-existent memory
-            with pytest.raises(ValueError, match="Memory not found"):
-                discovery.process_item("nonexistent-mem:mem-pg-config")
+        # Pair with non-existent memory
+        with pytest.raises(ValueError, match="Memory not found"):
+            discovery.process_item("nonexistent-mem:mem-pg-config")
 
     def test_live_mode_relation_creation_error(self, populated_storage: JSONLStorage) -> None:
         """RuntimeError when relation creation fails (covers lines 357-359)."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
-        with (
-            patch(
-                "cortexgraph.agents.relationship_discovery.get_storage",
-                return_value=populated_storage,
-            ),
-            patch(
-                "cortexgraph.agents.relationship_discovery.create_consolidation_issue",
-                return_value="mock-issue",
-            ),
-        ):
-            discovery = RelationshipDiscovery(
-                dry_run=False, min_shared_entities=2, min_confidence=0.3
-            )
-            discovery._storage = populated_storage
+        discovery = RelationshipDiscovery(
+            storage=populated_storage,
+            create_issue=_mock_create_issue,
+            close_issue=_mock_close_issue,
+            dry_run=False,
+            min_shared_entities=2,
+            min_confidence=0.3,
+        )
 
-            # Make create_relation fail
-            def fail_create(*args, **kwargs):
-                raise Exception("Database error")
+        # Make create_relation fail
+        def fail_create(*args, **kwargs):
+            raise Exception("Database error")
 
-            populated_storage.create_relation = fail_create
+        populated_storage.create_relation = fail_create
 
-            candidates = discovery.scan()
-            assert len(candidates) >= 1
+        candidates = discovery.scan()
+        assert len(candidates) >= 1
 
-            with pytest.raises(RuntimeError, match="Relation creation failed"):
-                discovery.process_item(candidates[0])
+        with pytest.raises(RuntimeError, match="Relation creation failed"):
+            discovery.process_item(candidates[0])
 
     def test_get_memory_via_storage_method(self, temp_storage: JSONLStorage) -> None:
         """_get_memory uses storage.get_memory when no dict (covers lines 368-374)."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         # Create storage mock with get_memory but no memories dict
         mock_storage = MagicMock()
         del mock_storage.memories  # Remove memories attribute
@@ -615,43 +555,27 @@ class TestRelationshipDiscoveryCoverageGaps:
         )
         mock_storage.get_memory.return_value = test_memory
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True)
 
-            result = discovery._get_memory("test-mem")
+        result = discovery._get_memory("test-mem")
 
-            assert result == test_memory
-            mock_storage.get_memory.assert_called_with("test-mem")
+        assert result == test_memory
+        mock_storage.get_memory.assert_called_with("test-mem")
 
     def test_get_memory_returns_none_on_exception(self, temp_storage: JSONLStorage) -> None:
         """_get_memory returns None when get_memory raises exception."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         mock_storage = MagicMock()
         del mock_storage.memories
         mock_storage.get_memory.side_effect = Exception("Not found")
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True)
 
-            result = discovery._get_memory("nonexistent")
+        result = discovery._get_memory("nonexistent")
 
-            assert result is None
+        assert result is None
 
     def test_calculate_relation_metrics_no_shared(self, temp_storage: JSONLStorage) -> None:
         """Reasoning shows 'No shared entities or tags' (covers line 436)."""
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         now = int(time.time())
 
         # Create two memories with NO shared entities or tags
@@ -680,29 +604,20 @@ class TestRelationshipDiscoveryCoverageGaps:
         temp_storage.save_memory(mem1)
         temp_storage.save_memory(mem2)
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=temp_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = temp_storage
+        discovery = RelationshipDiscovery(storage=temp_storage, dry_run=True)
 
-            # Call _calculate_relation_metrics with empty shared set
-            strength, confidence, reasoning = discovery._calculate_relation_metrics(
-                "mem-unique-1",
-                "mem-unique-2",
-                set(),  # No shared entities
-            )
+        # Call _calculate_relation_metrics with empty shared set
+        strength, confidence, reasoning = discovery._calculate_relation_metrics(
+            "mem-unique-1",
+            "mem-unique-2",
+            set(),  # No shared entities
+        )
 
-            assert reasoning == "No shared entities or tags"
-            assert strength == 0.0
+        assert reasoning == "No shared entities or tags"
+        assert strength == 0.0
 
     def test_scan_with_storage_list_memories_method(self, temp_storage: JSONLStorage) -> None:
         """Scan uses list_memories when available (covers lines 111-115)."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         now = int(time.time())
         memories = [
             Memory(
@@ -735,46 +650,28 @@ class TestRelationshipDiscoveryCoverageGaps:
         mock_storage.list_memories.return_value = memories
         mock_storage.relations = {}  # Empty relations
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=1)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True, min_shared_entities=1)
 
-            candidates = discovery.scan()
+        candidates = discovery.scan()
 
-            mock_storage.list_memories.assert_called_once()
-            assert len(candidates) >= 1
+        mock_storage.list_memories.assert_called_once()
+        assert len(candidates) >= 1
 
     def test_scan_with_storage_runtime_error(self, temp_storage: JSONLStorage) -> None:
         """Scan handles RuntimeError from storage (covers lines 116-118)."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         mock_storage = MagicMock()
         del mock_storage.memories
         mock_storage.list_memories.side_effect = RuntimeError("Storage not connected")
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True)
 
-            candidates = discovery.scan()
+        candidates = discovery.scan()
 
-            # Should return empty list, not raise
-            assert candidates == []
+        # Should return empty list, not raise
+        assert candidates == []
 
     def test_existing_relations_via_get_relations_method(self, temp_storage: JSONLStorage) -> None:
         """_get_existing_relation_pairs uses get_relations method (covers 195-205)."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         existing_rel = Relation(
             id="rel-1",
             from_memory_id="m1",
@@ -787,25 +684,16 @@ class TestRelationshipDiscoveryCoverageGaps:
         del mock_storage.relations  # Force method fallback
         mock_storage.get_relations.return_value = [existing_rel]
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True)
 
-            existing = discovery._get_existing_relation_pairs()
+        existing = discovery._get_existing_relation_pairs()
 
-            assert ("m1", "m2") in existing or ("m2", "m1") in existing
+        assert ("m1", "m2") in existing or ("m2", "m1") in existing
 
     def test_existing_relations_via_get_all_relations_method(
         self, temp_storage: JSONLStorage
     ) -> None:
         """_get_existing_relation_pairs falls back to get_all_relations (lines 206-215)."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         existing_rel = Relation(
             id="rel-1",
             from_memory_id="a1",
@@ -818,23 +706,14 @@ class TestRelationshipDiscoveryCoverageGaps:
         mock_storage = MagicMock(spec=["get_all_relations"])
         mock_storage.get_all_relations.return_value = [existing_rel]
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True)
 
-            existing = discovery._get_existing_relation_pairs()
+        existing = discovery._get_existing_relation_pairs()
 
-            assert ("a1", "b2") in existing or ("b2", "a1") in existing
+        assert ("a1", "b2") in existing or ("b2", "a1") in existing
 
     def test_scan_uses_get_all_memories_fallback(self, temp_storage: JSONLStorage) -> None:
         """Scan uses get_all_memories when list_memories not available (line 115)."""
-        from unittest.mock import MagicMock
-
-        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
-
         now = int(time.time())
         memories = [
             Memory(
@@ -866,14 +745,9 @@ class TestRelationshipDiscoveryCoverageGaps:
         mock_storage.get_all_memories.return_value = memories
         mock_storage.relations = {}
 
-        with patch(
-            "cortexgraph.agents.relationship_discovery.get_storage",
-            return_value=mock_storage,
-        ):
-            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=1)
-            discovery._storage = mock_storage
+        discovery = RelationshipDiscovery(storage=mock_storage, dry_run=True, min_shared_entities=1)
 
-            candidates = discovery.scan()
+        candidates = discovery.scan()
 
-            mock_storage.get_all_memories.assert_called_once()
-            assert len(candidates) >= 1
+        mock_storage.get_all_memories.assert_called_once()
+        assert len(candidates) >= 1
@@ -10,107 +10,123 @@ on real storage for the actual memory data.
 from __future__ import annotations
 
 import json
-import tempfile
 import time
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import uuid
+from collections.abc import Iterator
+from unittest.mock import MagicMock
 
 import pytest
 
+from cortexgraph.agents import semantic_merge as _sm
 from cortexgraph.agents.models import MergeResult
 from cortexgraph.agents.semantic_merge import SemanticMerge
 from cortexgraph.storage.jsonl_storage import JSONLStorage
-from cortexgraph.storage.models import Memory
+from cortexgraph.storage.models import Memory, MemoryMetadata
 
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def temp_storage_dir():
-    """Create temporary directory for test storage."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# Validated once at import; seed_memories stamps out the fixture memories
+# from it with ``model_copy``, which skips re-validation.
+_MEMORY_PROTOTYPE = Memory(id="prototype", content="prototype", strength=1.0)
 
 
-@pytest.fixture
-def test_storage(temp_storage_dir: Path) -> JSONLStorage:
-    """Create real JSONL storage with mergeable test data.
+@pytest.fixture(scope="module")
+def seed_memories() -> dict[str, Memory]:
+    """Build the mergeable test memories once per module.
 
     Creates memories that would have been flagged by ClusterDetector
     for potential merge based on entity similarity.
     """
-    storage = JSONLStorage(str(temp_storage_dir))
     now = int(time.time())
 
-    # PostgreSQL cluster - 3 memories with shared "PostgreSQL" entity
-    # These would have been flagged for MERGE by ClusterDetector
-    postgres_mem_1 = Memory(
-        id="pg-1",
-        content="PostgreSQL database configuration for production servers",
-        entities=["PostgreSQL", "Database", "Production"],
-        tags=["database", "config", "production"],
-        created_at=now - 86400,
-        last_used=now - 3600,
-        use_count=5,
-        strength=1.0,
-    )
-    postgres_mem_2 = Memory(
-        id="pg-2",
-        content="PostgreSQL connection pooling settings for optimal performance",
-        entities=["PostgreSQL", "ConnectionPool", "Performance"],
-        tags=["database", "performance", "pooling"],
-        created_at=now - 86400 * 2,
-        last_used=now - 7200,
-        use_count=3,
-        strength=1.0,
-    )
-    postgres_mem_3 = Memory(
-        id="pg-3",
-        content="PostgreSQL query optimization and index tuning tips",
-        entities=["PostgreSQL", "Query", "Index"],
-        tags=["database", "optimization", "indexing"],
-        created_at=now - 86400 * 3,
-        last_used=now - 10800,
-        use_count=2,
-        strength=1.0,
-    )
+    def make(memory_id: str, **fields: object) -> Memory:
+        return _MEMORY_PROTOTYPE.model_copy(update={"id": memory_id, **fields})
 
-    # JWT cluster - 2 memories with shared "JWT" entity
-    jwt_mem_1 = Memory(
-        id="jwt-1",
-        content="JWT token generation and signing workflow",
-        entities=["JWT", "Authentication", "Security"],
-        tags=["security", "auth", "tokens"],
-        created_at=now - 86400,
-        last_used=now - 1800,
-        use_count=8,
-        strength=1.2,
-    )
-    jwt_mem_2 = Memory(
-        id="jwt-2",
-        content="JWT refresh token rotation strategy for long sessions",
-        entities=["JWT", "RefreshToken", "Session"],
-        tags=["security", "auth", "sessions"],
-        created_at=now - 86400 * 2,
-        last_used=now - 3600,
-        use_count=4,
-        strength=1.0,
-    )
+    return {
+        # PostgreSQL cluster - 3 memories with shared "PostgreSQL" entity
+        # These would have been flagged for MERGE by ClusterDetector
+        "pg-1": make(
+            "pg-1",
+            content="PostgreSQL database configuration for production servers",
+            entities=["PostgreSQL", "Database", "Production"],
+            meta=MemoryMetadata(tags=["database", "config", "production"]),
+            created_at=now - 86400,
+            last_used=now - 3600,
+            use_count=5,
+        ),
+        "pg-2": make(
+            "pg-2",
+            content="PostgreSQL connection pooling settings for optimal performance",
+            entities=["PostgreSQL", "ConnectionPool", "Performance"],
+            meta=MemoryMetadata(tags=["database", "performance", "pooling"]),
+            created_at=now - 86400 * 2,
+            last_used=now - 7200,
+            use_count=3,
+        ),
+        "pg-3": make(
+            "pg-3",
+            content="PostgreSQL query optimization and index tuning tips",
+            entities=["PostgreSQL", "Query", "Index"],
+            meta=MemoryMetadata(tags=["database", "optimization", "indexing"]),
+            created_at=now - 86400 * 3,
+            last_used=now - 10800,
+            use_count=2,
+        ),
+        # JWT cluster - 2 memories with shared "JWT" entity
+        "jwt-1": make(
+            "jwt-1",
+            content="JWT token generation and signing workflow",
+            entities=["JWT", "Authentication", "Security"],
+            meta=MemoryMetadata(tags=["security", "auth", "tokens"]),
+            created_at=now - 86400,
+            last_used=now - 1800,
+            use_count=8,
+            strength=1.2,
+        ),
+        "jwt-2": make(
+            "jwt-2",
+            content="JWT refresh token rotation strategy for long sessions",
+            entities=["JWT", "RefreshToken", "Session"],
+            meta=MemoryMetadata(tags=["security", "auth", "sessions"]),
+            created_at=now - 86400 * 2,
+            last_used=now - 3600,
+            use_count=4,
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def test_storage(
+    seed_memories: dict[str, Memory], tmp_path_factory: pytest.TempPathFactory
+) -> JSONLStorage:
+    """Create in-memory JSONL storage with mergeable test data.
+
+    Built once per module. Tests stub storage methods through ``monkeypatch``
+    and ``_storage_snapshot`` restores the indexes, so nothing leaks between
+    tests.
+    """
+    # Point at a temp directory so nothing can read the user's configured storage
+    storage = JSONLStorage(tmp_path_factory.mktemp("semantic_merge"), persist=False)
 
     # Add memories to storage (direct assignment to bypass storage connection)
-    storage.memories = {
-        "pg-1": postgres_mem_1,
-        "pg-2": postgres_mem_2,
-        "pg-3": postgres_mem_3,
-        "jwt-1": jwt_mem_1,
-        "jwt-2": jwt_mem_2,
-    }
+    storage.memories = {mid: mem.model_copy(deep=True) for mid, mem in seed_memories.items()}
 
     return storage
 
 
+@pytest.fixture(autouse=True)
+def _storage_snapshot(test_storage: JSONLStorage) -> Iterator[None]:
+    """Roll the shared storage's memory and relation indexes back after each test."""
+    memories = dict(test_storage.memories)
+    relations = dict(test_storage.relations)
+    yield
+    test_storage.memories = memories
+    test_storage.relations = relations
+
+
 def create_merge_issue(
     issue_id: str,
     memory_ids: list[str],
@@ -133,6 +149,20 @@ def create_merge_issue(
     }
 
 
+# Canonical merge issues, built once. SemanticMerge only reads issue dicts,
+# so tests can share them.
+_ISSUES: dict[str, dict] = {
+    "pg3": create_merge_issue(
+        "cortexgraph-merge-pg", ["pg-1", "pg-2", "pg-3"], "cluster-postgresql"
+    ),
+    "pg2": create_merge_issue("cortexgraph-merge-pg", ["pg-1", "pg-2"], "cluster-postgresql"),
+    "pg13": create_merge_issue("cortexgraph-merge-pg", ["pg-1", "pg-3"], "cluster-postgresql"),
+    "jwt2": create_merge_issue("cortexgraph-merge-jwt", ["jwt-1", "jwt-2"], "cluster-jwt"),
+    "bad": create_merge_issue("cortexgraph-merge-bad", ["pg-1", "nonexistent-mem"], "cluster-bad"),
+    "fail": create_merge_issue("cortexgraph-merge-fail", ["pg-1", "pg-2"], "cluster-fail"),
+}
+
+
 @pytest.fixture
 def mock_beads() -> MagicMock:
     """Create mock beads integration."""
@@ -143,6 +173,17 @@ def mock_beads() -> MagicMock:
     return beads
 
 
+@pytest.fixture(autouse=True)
+def _patch_semantic_merge(
+    monkeypatch: pytest.MonkeyPatch, test_storage: JSONLStorage, mock_beads: MagicMock
+) -> None:
+    """Point SemanticMerge's storage and beads lookups at the test doubles."""
+    monkeypatch.setattr(_sm, "get_storage", lambda: test_storage)
+    monkeypatch.setattr(_sm, "query_consolidation_issues", mock_beads.query_consolidation_issues)
+    monkeypatch.setattr(_sm, "claim_issue", mock_beads.claim_issue)
+    monkeypatch.setattr(_sm, "close_issue", mock_beads.close_issue)
+
+
 # =============================================================================
 # T049: Integration Test - Full Merge with Relation Creation
 # =============================================================================
@@ -151,171 +192,78 @@ def mock_beads() -> MagicMock:
 class TestSemanticMergeIntegration:
     """End-to-end tests for SemanticMerge with real storage."""
 
-    def test_merge_postgresql_cluster(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
+    @pytest.mark.parametrize(
+        ("issue_key", "source_ids", "min_entities"),
+        [
+            # PostgreSQL shared + 6 unique: PostgreSQL, Database, Production,
+            # ConnectionPool, Performance, Query, Index
+            ("pg3", ["pg-1", "pg-2", "pg-3"], 7),
+            # JWT, Authentication, Security, RefreshToken, Session
+            ("jwt2", ["jwt-1", "jwt-2"], 5),
+        ],
+        ids=["postgresql", "jwt"],
+    )
+    def test_merge_cluster(
+        self,
+        mock_beads: MagicMock,
+        issue_key: str,
+        source_ids: list[str],
+        min_entities: int,
     ) -> None:
-        """Merge PostgreSQL cluster preserves all entities and content."""
-        # Create beads issue for the PostgreSQL cluster
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2", "pg-3"],
-            "cluster-postgresql",
-            cohesion=0.85,
-        )
+        """Merging a cluster preserves its sources and entities in a new memory."""
+        issue = _ISSUES[issue_key]
+        issue_id = issue["id"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
-
-            # Run scan and process
-            issue_ids = merge.scan()
-            assert len(issue_ids) == 1
-
-            result = merge.process_item(issue_ids[0])
-
-            # Verify result
-            assert isinstance(result, MergeResult)
-            assert result.success is True
-            assert len(result.source_ids) == 3
-            assert "pg-1" in result.source_ids
-            assert "pg-2" in result.source_ids
-            assert "pg-3" in result.source_ids
-
-            # All unique entities preserved (PostgreSQL shared + 6 unique)
-            # PostgreSQL, Database, Production, ConnectionPool, Performance, Query, Index
-            assert result.entities_preserved >= 7
-
-    def test_merge_jwt_cluster(self, test_storage: JSONLStorage, mock_beads: MagicMock) -> None:
-        """Merge JWT cluster with two memories."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-jwt",
-            ["jwt-1", "jwt-2"],
-            "cluster-jwt",
-            cohesion=0.78,
-        )
-        mock_beads.query_consolidation_issues.return_value = [issue]
+        merge = SemanticMerge(dry_run=True)
+
+        # Run scan and process
+        assert merge.scan() == [issue_id]
+        result = merge.process_item(issue_id)
+
+        assert isinstance(result, MergeResult)
+        assert result.success is True
+        assert set(result.source_ids) == set(source_ids)
+        # All unique entities preserved
+        assert result.entities_preserved >= min_entities
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
-
-            result = merge.process_item("cortexgraph-merge-jwt")
-
-            assert result.success is True
-            assert len(result.source_ids) == 2
-            # JWT, Authentication, Security, RefreshToken, Session = 5 unique entities
-            assert result.entities_preserved >= 5
+        # content_diff should describe the merge
+        assert f"Merged {len(source_ids)}" in result.content_diff
+
+        # Merged memory gets a valid UUID
+        try:
+            uuid.UUID(result.new_memory_id)
+        except ValueError:
+            pytest.fail(f"new_memory_id '{result.new_memory_id}' is not a valid UUID")
 
     def test_run_processes_multiple_issues(
         self, test_storage: JSONLStorage, mock_beads: MagicMock
     ) -> None:
         """run() processes all pending merge issues."""
         # Two merge issues in queue
-        issues = [
-            create_merge_issue(
-                "cortexgraph-merge-pg",
-                ["pg-1", "pg-2", "pg-3"],
-                "cluster-postgresql",
-            ),
-            create_merge_issue(
-                "cortexgraph-merge-jwt",
-                ["jwt-1", "jwt-2"],
-                "cluster-jwt",
-            ),
-        ]
+        issues = [_ISSUES["pg3"], _ISSUES["jwt2"]]
         mock_beads.query_consolidation_issues.return_value = issues
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
-
-            results = merge.run()
-
-            assert len(results) == 2
-            assert all(isinstance(r, MergeResult) for r in results)
-            assert all(r.success for r in results)
-
-    def test_content_diff_meaningful(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
-    ) -> None:
-        """content_diff provides meaningful merge description."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2", "pg-3"],
-            "cluster-postgresql",
-        )
-        mock_beads.query_consolidation_issues.return_value = [issue]
+        merge = SemanticMerge(dry_run=True)
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
-
-            result = merge.process_item("cortexgraph-merge-pg")
-
-            # content_diff should mention the merge
-            assert "3" in result.content_diff or "Merged" in result.content_diff
-            # Should reference entities if possible
-            assert len(result.content_diff) > 10  # Not empty
+        results = merge.run()
+
+        assert len(results) == 2
+        assert all(isinstance(r, MergeResult) for r in results)
+        assert all(r.success for r in results)
 
     def test_handles_missing_memory_gracefully(
         self, test_storage: JSONLStorage, mock_beads: MagicMock
     ) -> None:
         """Error when merge issue references non-existent memory."""
         # Issue references a memory that doesn't exist
-        issue = create_merge_issue(
-            "cortexgraph-merge-bad",
-            ["pg-1", "nonexistent-mem"],
-            "cluster-bad",
-        )
+        issue = _ISSUES["bad"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
-
-            with pytest.raises(ValueError, match="not found"):
-                merge.process_item("cortexgraph-merge-bad")
+        merge = SemanticMerge(dry_run=True)
+
+        with pytest.raises(ValueError, match="not found"):
+            merge.process_item("cortexgraph-merge-bad")
 
     def test_empty_queue_returns_empty_list(
         self, test_storage: JSONLStorage, mock_beads: MagicMock
@@ -323,112 +271,41 @@ class TestSemanticMergeIntegration:
         """No pending issues returns empty results."""
         mock_beads.query_consolidation_issues.return_value = []
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
+        merge = SemanticMerge(dry_run=True)
 
-            results = merge.run()
-            assert results == []
+        results = merge.run()
+        assert results == []
 
 
 class TestMergeResultIntegrity:
     """Tests verifying merge result integrity and completeness."""
 
-    def test_new_memory_id_is_valid_uuid(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
-    ) -> None:
-        """Merged memory gets a valid UUID."""
-        import uuid
-
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2"],
-            "cluster-postgresql",
-        )
-        mock_beads.query_consolidation_issues.return_value = [issue]
-
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
-
-            result = merge.process_item("cortexgraph-merge-pg")
-
-            # Should be a valid UUID
-            try:
-                uuid.UUID(result.new_memory_id)
-            except ValueError:
-                pytest.fail(f"new_memory_id '{result.new_memory_id}' is not a valid UUID")
-
     def test_source_ids_match_request(
         self, test_storage: JSONLStorage, mock_beads: MagicMock
     ) -> None:
         """Source IDs in result match the merge request."""
         requested_ids = ["pg-1", "pg-3"]
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            requested_ids,
-            "cluster-postgresql",
-        )
+        issue = _ISSUES["pg13"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
+        merge = SemanticMerge(dry_run=True)
 
-            result = merge.process_item("cortexgraph-merge-pg")
+        result = merge.process_item("cortexgraph-merge-pg")
 
-            assert set(result.source_ids) == set(requested_ids)
+        assert set(result.source_ids) == set(requested_ids)
 
     def test_beads_issue_id_recorded(
         self, test_storage: JSONLStorage, mock_beads: MagicMock
     ) -> None:
         """Beads issue ID is recorded in result for audit trail."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2"],
-            "cluster-postgresql",
-        )
+        issue = _ISSUES["pg2"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=True)
-            merge._storage = test_storage
+        merge = SemanticMerge(dry_run=True)
 
-            result = merge.process_item("cortexgraph-merge-pg")
+        result = merge.process_item("cortexgraph-merge-pg")
 
-            assert result.beads_issue_id == "cortexgraph-merge-pg"
+        assert result.beads_issue_id == "cortexgraph-merge-pg"
 
 
 # =============================================================================
@@ -440,15 +317,13 @@ class TestSemanticMergeLiveMode:
     """Tests for live mode (dry_run=False) to cover merge execution paths."""
 
     def test_live_merge_creates_memory_and_relations(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
+        self,
+        test_storage: JSONLStorage,
+        mock_beads: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Live merge creates new memory and consolidated_from relations."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2"],
-            "cluster-postgresql",
-            cohesion=0.85,
-        )
+        issue = _ISSUES["pg2"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
         # Mock storage methods for live mode
@@ -465,86 +340,65 @@ class TestSemanticMergeLiveMode:
         def mock_update_memory(mem_id: str, **kwargs) -> None:
             updated_memories[mem_id] = kwargs
 
-        test_storage.save_memory = MagicMock(side_effect=mock_save_memory)
-        test_storage.create_relation = MagicMock(side_effect=mock_create_relation)
-        test_storage.update_memory = MagicMock(side_effect=mock_update_memory)
-
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=False)  # LIVE MODE
-            merge._storage = test_storage
-
-            result = merge.process_item("cortexgraph-merge-pg")
-
-            # Verify result
-            assert result.success is True
-            assert len(result.source_ids) == 2
-            assert len(result.relation_ids) == 2  # One relation per source
-
-            # Verify memory was saved
-            assert len(saved_memories) == 1
-            merged_memory = saved_memories[0]
-            assert merged_memory.id == result.new_memory_id
-
-            # Verify relations were created
-            assert len(created_relations) == 2
-            for rel in created_relations:
-                assert rel.relation_type == "consolidated_from"
-                assert rel.from_memory_id == result.new_memory_id
-
-            # Verify original memories were archived
-            assert "pg-1" in updated_memories
-            assert "pg-2" in updated_memories
-            from cortexgraph.storage.models import MemoryStatus
-
-            assert updated_memories["pg-1"].get("status") == MemoryStatus.ARCHIVED
-
-            # Verify beads issue was closed
-            mock_beads.close_issue.assert_called_once()
+        monkeypatch.setattr(test_storage, "save_memory", MagicMock(side_effect=mock_save_memory))
+        monkeypatch.setattr(
+            test_storage, "create_relation", MagicMock(side_effect=mock_create_relation)
+        )
+        monkeypatch.setattr(
+            test_storage, "update_memory", MagicMock(side_effect=mock_update_memory)
+        )
+
+        merge = SemanticMerge(dry_run=False)  # LIVE MODE
+
+        result = merge.process_item("cortexgraph-merge-pg")
+
+        # Verify result
+        assert result.success is True
+        assert len(result.source_ids) == 2
+        assert len(result.relation_ids) == 2  # One relation per source
+
+        # Verify memory was saved
+        assert len(saved_memories) == 1
+        merged_memory = saved_memories[0]
+        assert merged_memory.id == result.new_memory_id
+
+        # Verify relations were created
+        assert len(created_relations) == 2
+        for rel in created_relations:
+            assert rel.relation_type == "consolidated_from"
+            assert rel.from_memory_id == result.new_memory_id
+
+        # Verify original memories were archived
+        assert "pg-1" in updated_memories
+        assert "pg-2" in updated_memories
+        from cortexgraph.storage.models import MemoryStatus
+
+        assert updated_memories["pg-1"].get("status") == MemoryStatus.ARCHIVED
+
+        # Verify beads issue was closed
+        mock_beads.close_issue.assert_called_once()
 
     def test_live_merge_claim_failure_raises_error(
         self, test_storage: JSONLStorage, mock_beads: MagicMock
     ) -> None:
         """Live merge raises error if beads issue claim fails."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-fail",
-            ["pg-1", "pg-2"],
-            "cluster-fail",
-        )
+        issue = _ISSUES["fail"]
         mock_beads.query_consolidation_issues.return_value = [issue]
         mock_beads.claim_issue.return_value = False  # Claim fails
 
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=False)
-            merge._storage = test_storage
-
-            with pytest.raises(RuntimeError, match="Failed to claim issue"):
-                merge.process_item("cortexgraph-merge-fail")
+        merge = SemanticMerge(dry_run=False)
+
+        with pytest.raises(RuntimeError, match="Failed to claim issue"):
+            merge.process_item("cortexgraph-merge-fail")
 
     def test_live_merge_preserves_timestamps(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
+        self,
+        test_storage: JSONLStorage,
+        mock_beads: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Live merge preserves earliest created_at and latest last_used."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2", "pg-3"],
-            "cluster-postgresql",
-        )
+        issue = _ISSUES["pg3"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
         saved_memories: list[Memory] = []
@@ -552,51 +406,39 @@ class TestSemanticMergeLiveMode:
         def mock_save_memory(memory: Memory) -> None:
             saved_memories.append(memory)
 
-        test_storage.save_memory = MagicMock(side_effect=mock_save_memory)
-        test_storage.create_relation = MagicMock()
-        test_storage.update_memory = MagicMock()
-
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=False)
-            merge._storage = test_storage
-
-            result = merge.process_item("cortexgraph-merge-pg")
-
-            assert result.success is True
-            merged = saved_memories[0]
-
-            # Should have earliest created_at from pg-3 (86400 * 3 seconds ago)
-            pg3 = test_storage.memories["pg-3"]
-            assert merged.created_at == pg3.created_at
-
-            # Should have latest last_used from pg-1 (3600 seconds ago)
-            pg1 = test_storage.memories["pg-1"]
-            assert merged.last_used == pg1.last_used
-
-            # Total use count should be sum
-            expected_use_count = sum(
-                test_storage.memories[mid].use_count for mid in ["pg-1", "pg-2", "pg-3"]
-            )
-            assert merged.use_count == expected_use_count
+        monkeypatch.setattr(test_storage, "save_memory", MagicMock(side_effect=mock_save_memory))
+        monkeypatch.setattr(test_storage, "create_relation", MagicMock())
+        monkeypatch.setattr(test_storage, "update_memory", MagicMock())
+
+        merge = SemanticMerge(dry_run=False)
+
+        result = merge.process_item("cortexgraph-merge-pg")
+
+        assert result.success is True
+        merged = saved_memories[0]
+
+        # Should have earliest created_at from pg-3 (86400 * 3 seconds ago)
+        pg3 = test_storage.memories["pg-3"]
+        assert merged.created_at == pg3.created_at
+
+        # Should have latest last_used from pg-1 (3600 seconds ago)
+        pg1 = test_storage.memories["pg-1"]
+        assert merged.last_used == pg1.last_used
+
+        # Total use count should be sum
+        expected_use_count = sum(
+            test_storage.memories[mid].use_count for mid in ["pg-1", "pg-2", "pg-3"]
+        )
+        assert merged.use_count == expected_use_count
 
     def test_live_merge_uses_smart_content_merging(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
+        self,
+        test_storage: JSONLStorage,
+        mock_beads: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Live merge uses consolidation module for intelligent content merging."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2"],
-            "cluster-postgresql",
-            cohesion=0.9,
-        )
+        issue = _ISSUES["pg2"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
         saved_memories: list[Memory] = []
@@ -604,64 +446,45 @@ class TestSemanticMergeLiveMode:
         def mock_save_memory(memory: Memory) -> None:
             saved_memories.append(memory)
 
-        test_storage.save_memory = MagicMock(side_effect=mock_save_memory)
-        test_storage.create_relation = MagicMock()
-        test_storage.update_memory = MagicMock()
-
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=False)
-            merge._storage = test_storage
-
-            result = merge.process_item("cortexgraph-merge-pg")
-
-            assert result.success is True
-            merged = saved_memories[0]
-
-            # Merged content should include info from both sources
-            pg1_content = test_storage.memories["pg-1"].content
-            pg2_content = test_storage.memories["pg-2"].content
-            assert pg1_content in merged.content or pg2_content in merged.content
-
-            # Entities should be merged (union)
-            pg1_entities = set(test_storage.memories["pg-1"].entities)
-            pg2_entities = set(test_storage.memories["pg-2"].entities)
-            merged_entities = set(merged.entities)
-            assert pg1_entities.issubset(merged_entities)
-            assert pg2_entities.issubset(merged_entities)
+        monkeypatch.setattr(test_storage, "save_memory", MagicMock(side_effect=mock_save_memory))
+        monkeypatch.setattr(test_storage, "create_relation", MagicMock())
+        monkeypatch.setattr(test_storage, "update_memory", MagicMock())
+
+        merge = SemanticMerge(dry_run=False)
+
+        result = merge.process_item("cortexgraph-merge-pg")
+
+        assert result.success is True
+        merged = saved_memories[0]
+
+        # Merged content should include info from both sources
+        pg1_content = test_storage.memories["pg-1"].content
+        pg2_content = test_storage.memories["pg-2"].content
+        assert pg1_content in merged.content or pg2_content in merged.content
+
+        # Entities should be merged (union)
+        pg1_entities = set(test_storage.memories["pg-1"].entities)
+        pg2_entities = set(test_storage.memories["pg-2"].entities)
+        merged_entities = set(merged.entities)
+        assert pg1_entities.issubset(merged_entities)
+        assert pg2_entities.issubset(merged_entities)
 
     def test_live_merge_error_handling(
-        self, test_storage: JSONLStorage, mock_beads: MagicMock
+        self,
+        test_storage: JSONLStorage,
+        mock_beads: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Live merge wraps errors in RuntimeError."""
-        issue = create_merge_issue(
-            "cortexgraph-merge-pg",
-            ["pg-1", "pg-2"],
-            "cluster-postgresql",
-        )
+        issue = _ISSUES["pg2"]
         mock_beads.query_consolidation_issues.return_value = [issue]
 
         # Make save_memory raise an error
-        test_storage.save_memory = MagicMock(side_effect=Exception("Storage error"))
-
-        with (
-            patch("cortexgraph.agents.semantic_merge.get_storage", return_value=test_storage),
-            patch(
-                "cortexgraph.agents.semantic_merge.query_consolidation_issues",
-                mock_beads.query_consolidation_issues,
-            ),
-            patch("cortexgraph.agents.semantic_merge.claim_issue", mock_beads.claim_issue),
-            patch("cortexgraph.agents.semantic_merge.close_issue", mock_beads.close_issue),
-        ):
-            merge = SemanticMerge(dry_run=False)
-            merge._storage = test_storage
-
-            with pytest.raises(RuntimeError, match="Merge failed"):
-                merge.process_item("cortexgraph-merge-pg")
+        monkeypatch.setattr(
+            test_storage, "save_memory", MagicMock(side_effect=Exception("Storage error"))
+        )
+
+        merge = SemanticMerge(dry_run=False)
+
+        with pytest.raises(RuntimeError, match="Merge failed"):
+            merge.process_item("cortexgraph-merge-pg")
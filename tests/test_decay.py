@@ -9,9 +9,11 @@ from cortexgraph.core.decay import (
     calculate_decay_lambda,
     calculate_halflife,
     calculate_score,
+    calculate_scores,
     project_score_at_time,
     time_until_threshold,
 )
+from cortexgraph.storage.models import Memory
 
 
 def test_calculate_score_basic():
@@ -582,3 +584,37 @@ def test_project_score_different_models():
     assert score_pl > 0
     assert score_tc > 0
     assert score_exp > 0
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        Config(decay_model="power_law", pl_alpha=1.1, pl_halflife_days=3.0),
+        Config(
+            decay_model="two_component",
+            tc_lambda_fast=1.603e-5,
+            tc_lambda_slow=1.147e-6,
+            tc_weight_fast=0.7,
+        ),
+        Config(decay_model="exponential", decay_lambda=2.673e-6),
+    ],
+    ids=["power_law", "two_component", "exponential"],
+)
+def test_calculate_scores_matches_calculate_score(config):
+    """Test that batch scoring matches per-memory scoring for every decay model."""
+    set_config(config)
+    now = int(time.time())
+    memories = [
+        Memory(
+            id=f"m{i}", content="x", use_count=i, last_used=now - i * 86400, strength=1.0 + i / 10
+        )
+        for i in range(5)
+    ]
+
+    scores = calculate_scores(memories, now=now)
+
+    assert scores == [
+        calculate_score(use_count=m.use_count, last_used=m.last_used, strength=m.strength, now=now)
+        for m in memories
+    ]
+    assert calculate_scores([], now=now) == []
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
+from cortexgraph.storage import ltm_index
 from cortexgraph.storage.ltm_index import LTMDocument, LTMIndex
 
 
@@ -329,6 +331,58 @@ def test_build_index_handles_parse_errors(tmp_path: Path, capsys) -> None:
     assert "Warning: Failed to parse" in captured.out
 
 
+def test_build_index_parallel_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    """Test parallel parsing indexes the same as serial parsing."""
+    monkeypatch.setattr(LTMIndex, "PARALLEL_PARSE_THRESHOLD", 2)
+    monkeypatch.setattr(LTMIndex, "PARSE_CHUNK_SIZE", 8)
+    monkeypatch.setattr(ltm_index.os, "cpu_count", lambda: 2)
+
+    vault = tmp_path / "vault"
+    count = 20
+    for i in range(count):
+        write_md(
+            vault / f"dir{i % 3}" / f"note{i}.md",
+            f"---\ntitle: Note {i}\ntags: [t{i % 4}]\n---\nSee [[Note {i + 1}]] #n{i}\n",
+        )
+    (vault / "dir0" / "bad.md").write_bytes(b"\x80\x81\x82")
+
+    index = LTMIndex(vault_path=vault)
+    index.build_index(force=True, parallel=True)
+
+    assert index.get_stats()["total_documents"] == count
+    for path in (vault / "dir0").glob("note*.md"):
+        rel_path = path.relative_to(vault).as_posix()
+        expected = index.parse_markdown_file(path)
+        assert expected is not None
+        parsed = index.get_document(rel_path)
+        assert parsed is not None
+        assert parsed.title == expected.title
+        assert sorted(parsed.tags) == sorted(expected.tags)
+        assert parsed.wikilinks == expected.wikilinks
+
+
+@pytest.mark.parametrize(("parallel", "cpu_count"), [(False, 8), (True, 1)])
+def test_build_index_parses_serially_without_workers(
+    tmp_path: Path, monkeypatch, parallel: bool, cpu_count: int
+) -> None:
+    """Test no process pool is created unless requested and useful."""
+    monkeypatch.setattr(LTMIndex, "PARALLEL_PARSE_THRESHOLD", 2)
+    monkeypatch.setattr(ltm_index.os, "cpu_count", lambda: cpu_count)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("process pool should not be created")
+
+    monkeypatch.setattr(ltm_index, "ProcessPoolExecutor", fail)
+    vault = tmp_path / "vault"
+    for i in range(5):
+        write_md(vault / f"note{i}.md", f"Note {i}")
+
+    index = LTMIndex(vault_path=vault)
+    index.build_index(force=True, parallel=parallel)
+
+    assert index.get_stats()["total_documents"] == 5
+
+
 def test_save_and_load_index(tmp_path: Path) -> None:
     """Test saving and loading index to/from JSONL."""
     vault = tmp_path / "vault"
@@ -361,6 +415,75 @@ Content with [[link]] and #hashtag
     assert "hashtag" in doc.tags
 
 
+def test_load_index_reuses_parsed_index_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    """Test repeated loads skip JSON parsing until the index file is rewritten."""
+    vault = tmp_path / "vault"
+    write_md(vault / "note.md", "# Note\nContent")
+    LTMIndex(vault_path=vault).build_index()
+
+    parsed: list[str] = []
+    original_from_dict = LTMDocument.from_dict
+
+    def counting_from_dict(data):
+        parsed.append(data["path"])
+        return original_from_dict(data)
+
+    monkeypatch.setattr(LTMDocument, "from_dict", staticmethod(counting_from_dict))
+
+    index = LTMIndex(vault_path=vault)
+    index.load_index()
+    assert index.get_document("note.md") is not None
+    assert parsed == []
+
+    # An external rewrite of the index file invalidates the cached copy
+    index.index_path.write_text(
+        index.index_path.read_text().replace('"title": "note"', '"title": "renamed"'),
+        encoding="utf-8",
+    )
+    reloaded = LTMIndex(vault_path=vault)
+    reloaded.load_index()
+    assert parsed == ["note.md"]
+    doc = reloaded.get_document("note.md")
+    assert doc is not None and doc.title == "renamed"
+
+
+def test_loaded_index_cache_keeps_recent_files_only(tmp_path: Path) -> None:
+    """Test the process-wide cache of parsed index files stays bounded."""
+    indexes = []
+    for i in range(ltm_index._LOADED_INDEX_LIMIT + 2):
+        vault = tmp_path / f"vault{i}"
+        write_md(vault / "note.md", "# Note\nContent")
+        index = LTMIndex(vault_path=vault)
+        index.build_index()
+        indexes.append(index)
+
+    assert len(ltm_index._LOADED_INDEXES) == ltm_index._LOADED_INDEX_LIMIT
+    assert list(ltm_index._LOADED_INDEXES) == [
+        index.index_path for index in indexes[-ltm_index._LOADED_INDEX_LIMIT :]
+    ]
+
+
+def test_loaded_index_cache_is_thread_safe(tmp_path: Path) -> None:
+    """Test concurrent loads of more indexes than the cache holds stay consistent."""
+    indexes = []
+    for i in range(ltm_index._LOADED_INDEX_LIMIT + 2):
+        vault = tmp_path / f"vault{i}"
+        write_md(vault / "note.md", f"# Note {i}\nContent")
+        index = LTMIndex(vault_path=vault)
+        index.build_index()
+        indexes.append(index)
+
+    def load_all(_: int) -> None:
+        for _ in range(50):
+            for index in indexes:
+                LTMIndex(vault_path=index.vault_path).load_index()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(load_all, range(8)))
+
+    assert len(ltm_index._LOADED_INDEXES) == ltm_index._LOADED_INDEX_LIMIT
+
+
 def test_load_index_nonexistent_file(tmp_path: Path) -> None:
     """Test load_index handles nonexistent file gracefully."""
     vault = tmp_path / "vault"
@@ -610,6 +733,25 @@ def test_get_forward_links_no_matches(tmp_path: Path) -> None:
     assert len(forward_links) == 0
 
 
+def test_link_lookups_follow_document_changes(tmp_path: Path) -> None:
+    """Test backlinks and forward links stay correct as documents are added."""
+    vault = tmp_path / "vault"
+    write_md(vault / "hub.md", "---\ntitle: Hub\n---\nSee [[Spoke]] and [[Spoke]]")
+    write_md(vault / "other.md", "---\ntitle: Other\n---\nAlso [[Hub]]")
+
+    index = LTMIndex(vault_path=vault)
+    index.build_index(verbose=False)
+    assert index.get_forward_links("hub.md") == []
+    assert [d.path for d in index.get_backlinks("Hub")] == ["other.md"]
+
+    write_md(vault / "spoke.md", "---\ntitle: Spoke\n---\nBack to [[Hub]]")
+    assert index.add_document(vault / "spoke.md")
+
+    assert [d.path for d in index.get_forward_links("hub.md")] == ["spoke.md"]
+    assert sorted(d.path for d in index.get_backlinks("Hub")) == ["other.md", "spoke.md"]
+    assert [d.path for d in index.get_backlinks("Spoke")] == ["hub.md"]
+
+
 def test_extract_wikilinks_with_aliases(tmp_path: Path) -> None:
     """Test wikilink extraction handles [[link|alias]] format."""
     vault = tmp_path / "vault"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 
@@ -11,7 +12,12 @@ from cortexgraph.config import Config, set_config
 from cortexgraph.context import db
 from cortexgraph.storage.ltm_index import LTMIndex
 from cortexgraph.storage.models import Memory, MemoryMetadata
-from cortexgraph.tools.search_unified import UnifiedSearchResult, format_results, search_unified
+from cortexgraph.tools.search_unified import (
+    UnifiedSearchResult,
+    _fuse_rankings,
+    format_results,
+    search_unified,
+)
 
 
 class TestUnifiedSearchResult:
@@ -242,6 +248,32 @@ class TestSearchUnified:
 
         assert result["success"] is True
 
+    def test_queries_sources_concurrently(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that STM and LTM are searched at the same time, not one after another."""
+        from cortexgraph.tools import search_unified as search_unified_module
+
+        # Each side blocks until the other has started; a serial call would time out
+        barrier = threading.Barrier(2, timeout=5)
+        threads: dict[str, threading.Thread] = {}
+
+        def fake_search(source: str):
+            def search(params, weight):
+                threads[source] = threading.current_thread()
+                barrier.wait()
+                return [UnifiedSearchResult(content=source, title=source, source=source, score=1)]
+
+            return search
+
+        monkeypatch.setattr(search_unified_module, "_search_stm", fake_search("stm"))
+        monkeypatch.setattr(search_unified_module, "_search_ltm", fake_search("ltm"))
+
+        result = search_unified(query="anything")
+
+        assert {r["source"] for r in result["results"]} == {"stm", "ltm"}
+        # Only LTM is handed to a worker; STM stays on the calling thread
+        assert threads["stm"] is threading.current_thread()
+        assert threads["ltm"] is not threading.current_thread()
+
     def test_search_with_window_days(self, tmp_path: Path) -> None:
         """Test search with window_days parameter."""
         storage_dir = tmp_path / "jsonl"
@@ -445,6 +477,58 @@ class TestSearchUnified:
         scores = [r.score for r in results]
         assert scores == sorted(scores, reverse=True)
 
+    def test_rrf_ranks_item_in_both_sources_above_single_source_item(self) -> None:
+        """Test that fusion favours agreement across sources over a raw score."""
+        stm = [
+            UnifiedSearchResult(content="Only in STM", title="a", source="stm", score=0.95),
+            UnifiedSearchResult(content="Shared note", title="b", source="stm", score=0.4),
+        ]
+        ltm = [UnifiedSearchResult(content="Shared note", title="b", source="ltm", score=0.2)]
+
+        fused = _fuse_rankings([(stm, 1.0), (ltm, 1.0)])
+
+        assert [r.content for r in fused] == ["Shared note", "Only in STM"]
+        assert fused[0].source == "stm"  # Higher raw score kept for display
+        assert fused[0].score == 0.4
+        assert fused[0].rrf_score == pytest.approx(1 / 62 + 1 / 61)
+        assert fused[1].rrf_score == pytest.approx(1 / 61)
+
+    def test_rrf_applies_source_weights(self) -> None:
+        """Test that source weights scale each list's rank contribution."""
+        stm = [UnifiedSearchResult(content="stm item", title="s", source="stm", score=0.1)]
+        ltm = [UnifiedSearchResult(content="ltm item", title="l", source="ltm", score=0.9)]
+
+        fused = _fuse_rankings([(stm, 1.0), (ltm, 0.7)])
+
+        assert [r.source for r in fused] == ["stm", "ltm"]
+
+    def test_search_returns_fused_duplicates_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test duplicates across sources are merged by fusion and results are capped."""
+        from cortexgraph.tools import search_unified as search_unified_module
+
+        def fake_search(source: str, contents: list[str]):
+            def search(params, weight):
+                return [
+                    UnifiedSearchResult(content=c, title=c, source=source, score=1.0 - i / 10)
+                    for i, c in enumerate(contents)
+                ]
+
+            return search
+
+        monkeypatch.setattr(
+            search_unified_module, "_search_stm", fake_search("stm", ["Shared", "A", "B"])
+        )
+        monkeypatch.setattr(
+            search_unified_module, "_search_ltm", fake_search("ltm", ["shared ", "C"])
+        )
+
+        result = search_unified(query="anything", limit=3)
+
+        contents = [r["content"] for r in result["results"]]
+        assert result["count"] == 3
+        assert contents[0] == "Shared"
+        assert len({c.lower().strip() for c in contents}) == 3
+
 
 class TestSearchUnifiedValidation:
     """Test validation errors in search_unified."""
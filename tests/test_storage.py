@@ -86,13 +86,16 @@ def test_delete_memory(temp_storage):
 def test_list_memories(temp_storage):
     """Test listing memories with filters."""
     # Create some test memories
-    for i in range(5):
-        memory = Memory(
-            id=f"mem-{i}",
-            content=f"Memory {i}",
-            status=MemoryStatus.ACTIVE if i < 3 else MemoryStatus.PROMOTED,
-        )
-        temp_storage.save_memory(memory)
+    temp_storage.save_memories_batch(
+        [
+            Memory(
+                id=f"mem-{i}",
+                content=f"Memory {i}",
+                status=MemoryStatus.ACTIVE if i < 3 else MemoryStatus.PROMOTED,
+            )
+            for i in range(5)
+        ]
+    )
 
     # List all active memories
     active = temp_storage.list_memories(status=MemoryStatus.ACTIVE)
@@ -121,9 +124,7 @@ def test_search_memories_by_tags(temp_storage):
         meta=MemoryMetadata(tags=["python", "guide"]),
     )
 
-    temp_storage.save_memory(mem1)
-    temp_storage.save_memory(mem2)
-    temp_storage.save_memory(mem3)
+    temp_storage.save_memories_batch([mem1, mem2, mem3])
 
     # Search for python tag
     results = temp_storage.search_memories(tags=["python"])
@@ -712,6 +713,30 @@ def test_data_persists_across_connections():
         storage2.close()
 
 
+def test_persist_false_skips_disk_writes():
+    """Test that persist=False keeps changes in memory without touching the files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = JSONLStorage(storage_path=Path(tmpdir), persist=False)
+        storage.connect()
+
+        mem = Memory(id="mem-1", content="In-memory only", meta=MemoryMetadata(tags=["t"]))
+        storage.save_memory(mem)
+        storage.save_memories_batch([Memory(id="mem-2", content="Batch")])
+        storage.create_relation(
+            Relation(id="rel-1", from_memory_id="mem-1", to_memory_id="mem-2", relation_type="x")
+        )
+        storage.delete_memories_batch(["mem-2"])
+        storage.compact()
+
+        assert storage.get_memory("mem-1") is not None
+        assert storage.get_memory("mem-2") is None
+        assert len(storage.get_all_relations()) == 1
+        assert not storage.memories_path.exists()
+        assert not storage.relations_path.exists()
+
+        storage.close()
+
+
 def test_compact_with_relations(temp_storage):
     """Test compact also works with relations."""
     # First create memories that relations will reference
@@ -1056,7 +1081,7 @@ def test_operations_require_connection_all_methods():
 
 
 def test_save_memories_batch_updates_tag_index(temp_storage):
-    """Test that batch save doesn't update tag index (as per implementation)."""
+    """Test that batch save keeps the tag index in step with saved memories."""
     memories = [
         Memory(id=f"batch-tag-{i}", content=f"Memory {i}", meta=MemoryMetadata(tags=[f"tag{i}"]))
         for i in range(3)
@@ -1069,3 +1094,11 @@ def test_save_memories_batch_updates_tag_index(temp_storage):
     for i in range(3):
         mem = temp_storage.get_memory(f"batch-tag-{i}")
         assert mem is not None
+
+    assert {m.id for m in temp_storage.search_memories(tags=["tag1"])} == {"batch-tag-1"}
+
+    # Re-saving with different tags must drop the stale tag entry
+    retagged = memories[1].model_copy(update={"meta": MemoryMetadata(tags=["retagged"])})
+    temp_storage.save_memories_batch([retagged])
+    assert temp_storage.search_memories(tags=["tag1"]) == []
+    assert {m.id for m in temp_storage.search_memories(tags=["retagged"])} == {"batch-tag-1"}
@@ -0,0 +1,21 @@
+"""Shared fixtures for activation unit tests."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from cortexgraph.activation import entity_extraction
+
+
+@pytest.fixture(autouse=True)
+def _fresh_default_extraction(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Give each test a fresh extract_entities() extractor and result cache.
+
+    Tests patch EntityExtractor, so neither the shared default extractor nor
+    results cached by one test may leak into another. The spaCy model cache
+    is left alone; only tests that patch the loader clear it.
+    """
+    monkeypatch.setattr(entity_extraction, "_default_extractor", None)
+    entity_extraction._extract_entities_cached.cache_clear()
+    yield
+    entity_extraction._extract_entities_cached.cache_clear()
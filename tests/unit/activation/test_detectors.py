@@ -333,6 +333,15 @@ class TestDetectRecallIntent:
         assert "past_reference" in analysis.phrase_signals
         assert analysis.confidence > 0.5
 
+    @pytest.mark.parametrize(
+        "keyword", ["said", "Told", "discussed", "MENTIONED", "Last Time", "previously"]
+    )
+    def test_past_reference_keywords(self, test_config, test_matcher, keyword):
+        """Test every past-reference keyword is matched case-insensitively."""
+        analysis = detect_recall_intent(f"the thing {keyword} about it", test_config, test_matcher)
+
+        assert "past_reference" in analysis.phrase_signals
+
     def test_question_marker_detection(self, test_config, test_matcher):
         """Test question markers increase recall likelihood."""
         query = "What database preferences do we have?"
@@ -13,6 +13,17 @@ Tests EntityExtractor and extract_entities() for:
 import pytest
 
 from cortexgraph.activation.entity_extraction import EntityExtractor, extract_entities
+from cortexgraph.preprocessing.entity_extractor import STOPWORDS
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """Shared EntityExtractor, so the spaCy model is loaded once per module.
+
+    Tests that need the regex fallback must disable spaCy with
+    ``monkeypatch.setattr(extractor, "nlp", None)`` so the change is undone.
+    """
+    return EntityExtractor()
 
 
 class TestEntityExtractorInit:
@@ -33,6 +44,35 @@ class TestEntityExtractorInit:
 
         assert extractor.tech_regex is not None
 
+    def test_spacy_model_loaded_once_per_name(self, monkeypatch):
+        """Test repeated construction reuses the loaded spaCy model."""
+        from types import SimpleNamespace
+
+        from cortexgraph.preprocessing import entity_extractor
+
+        loads: list[str] = []
+
+        def fake_load(name):
+            loads.append(name)
+            if name == "missing_model":
+                raise OSError(name)
+            return object()
+
+        monkeypatch.setattr(entity_extractor, "SPACY_AVAILABLE", True)
+        monkeypatch.setattr(entity_extractor, "spacy", SimpleNamespace(load=fake_load))
+        entity_extractor._load_spacy_model.cache_clear()
+        try:
+            first = EntityExtractor(model_name="fake_model")
+            second = EntityExtractor(model_name="fake_model")
+            EntityExtractor(model_name="missing_model")
+            missing = EntityExtractor(model_name="missing_model")
+        finally:
+            entity_extractor._load_spacy_model.cache_clear()
+
+        assert first.nlp is second.nlp is not None
+        assert missing.nlp is None
+        assert loads == ["fake_model", "missing_model"]
+
     def test_is_available_method(self):
         """Test is_available() indicates spaCy status."""
         extractor = EntityExtractor()
@@ -45,79 +85,54 @@ class TestEntityExtractorInit:
 class TestTechnologyPatternMatching:
     """Tests for technology-specific pattern extraction."""
 
-    def test_ai_model_detection(self):
-        """Test AI model names are extracted."""
-        extractor = EntityExtractor()
-        text = "I prefer Claude over GPT-4 for coding tasks"
-
-        entities = extractor.extract(text)
-
-        assert "claude" in entities
-        assert "gpt-4" in entities
-
-    def test_framework_detection(self):
-        """Test framework names are extracted."""
-        extractor = EntityExtractor()
-        text = "FastAPI and Django are Python frameworks"
-
-        entities = extractor.extract(text)
-
-        assert "fastapi" in entities
-        assert "django" in entities
-        assert "python" in entities
-
-    def test_language_detection(self):
-        """Test programming language names."""
-        extractor = EntityExtractor()
-        text = "I use Python, JavaScript, and Rust"
-
-        entities = extractor.extract(text)
-
-        assert "python" in entities
-        assert "javascript" in entities
-        assert "rust" in entities
-
-    def test_protocol_detection(self):
-        """Test protocol names are extracted."""
-        extractor = EntityExtractor()
-        text = "MCP uses HTTP and WebSocket for transport"
-
-        entities = extractor.extract(text)
-
-        assert "mcp" in entities
-        assert "http" in entities
-        assert "websocket" in entities
-
-    def test_database_detection(self):
-        """Test database names are extracted."""
-        extractor = EntityExtractor()
-        text = "I prefer PostgreSQL over MongoDB for my project"
-
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param(
+                "I prefer Claude over GPT-4 for coding tasks",
+                ["claude", "gpt-4"],
+                id="ai_models",
+            ),
+            pytest.param(
+                "FastAPI and Django are Python frameworks",
+                ["fastapi", "django", "python"],
+                id="frameworks",
+            ),
+            pytest.param(
+                "I use Python, JavaScript, and Rust",
+                ["python", "javascript", "rust"],
+                id="languages",
+            ),
+            pytest.param(
+                "MCP uses HTTP and WebSocket for transport",
+                ["mcp", "http", "websocket"],
+                id="protocols",
+            ),
+            pytest.param(
+                "I prefer PostgreSQL over MongoDB for my project",
+                ["postgresql", "mongodb"],
+                id="databases",
+            ),
+            pytest.param(
+                "POSTGRESQL and fastapi and PyTorch",
+                ["postgresql", "fastapi", "pytorch"],
+                id="case_insensitive",
+            ),
+        ],
+    )
+    def test_technology_detection(self, extractor, text, expected):
+        """Test technology names are extracted and lowercased."""
         entities = extractor.extract(text)
 
-        assert "postgresql" in entities
-        assert "mongodb" in entities
-
-    def test_case_insensitive_tech_matching(self):
-        """Test technology patterns match case-insensitively."""
-        extractor = EntityExtractor()
-        text = "POSTGRESQL and fastapi and PyTorch"
-
-        entities = extractor.extract(text)
-
-        # All should be lowercase in output
-        assert "postgresql" in entities
-        assert "fastapi" in entities
-        assert "pytorch" in entities
+        for name in expected:
+            assert name in entities
 
 
 class TestSpacyEntityExtraction:
     """Tests for spaCy-based entity extraction (if available)."""
 
-    def test_spacy_person_entity(self):
+    def test_spacy_person_entity(self, extractor):
         """Test PERSON entities extracted if spaCy available."""
-        extractor = EntityExtractor()
-
         if not extractor.is_available():
             pytest.skip("spaCy model not available")
 
@@ -129,10 +144,8 @@ class TestSpacyEntityExtraction:
         # Note: This may be flaky depending on spaCy model
         assert any("scot" in e or "campbell" in e for e in entities)
 
-    def test_spacy_org_entity(self):
+    def test_spacy_org_entity(self, extractor):
         """Test ORG entities extracted if spaCy available."""
-        extractor = EntityExtractor()
-
         if not extractor.is_available():
             pytest.skip("spaCy model not available")
 
@@ -143,10 +156,8 @@ class TestSpacyEntityExtraction:
         # Should extract organization names
         assert "anthropic" in entities or "openai" in entities
 
-    def test_spacy_product_entity(self):
+    def test_spacy_product_entity(self, extractor):
         """Test PRODUCT entities extracted if spaCy available."""
-        extractor = EntityExtractor()
-
         if not extractor.is_available():
             pytest.skip("spaCy model not available")
 
@@ -158,10 +169,8 @@ class TestSpacyEntityExtraction:
         # Claude will be detected by tech patterns
         assert "claude" in entities
 
-    def test_spacy_gpe_entity(self):
+    def test_spacy_gpe_entity(self, extractor):
         """Test GPE (location) entities extracted if spaCy available."""
-        extractor = EntityExtractor()
-
         if not extractor.is_available():
             pytest.skip("spaCy model not available")
 
@@ -176,13 +185,10 @@ class TestSpacyEntityExtraction:
 class TestFallbackPatternExtraction:
     """Tests for fallback regex patterns when spaCy unavailable."""
 
-    def test_fallback_capitalized_words(self):
+    def test_fallback_capitalized_words(self, extractor, monkeypatch):
         """Test fallback extracts capitalized words."""
-        extractor = EntityExtractor()
-
         # Force fallback by setting nlp to None
-        original_nlp = extractor.nlp
-        extractor.nlp = None
+        monkeypatch.setattr(extractor, "nlp", None)
 
         text = "Remember this: John Smith works at Acme Corporation"
 
@@ -194,16 +200,10 @@ class TestFallbackPatternExtraction:
             "john smith" in e or "acme corporation" in e or "remember" in e for e in entities
         )
 
-        # Restore original nlp
-        extractor.nlp = original_nlp
-
-    def test_fallback_email_detection(self):
+    def test_fallback_email_detection(self, extractor, monkeypatch):
         """Test fallback extracts email addresses."""
-        extractor = EntityExtractor()
-
         # Force fallback
-        original_nlp = extractor.nlp
-        extractor.nlp = None
+        monkeypatch.setattr(extractor, "nlp", None)
 
         text = "Contact me at scot@prefrontal.systems for details"
 
@@ -212,15 +212,10 @@ class TestFallbackPatternExtraction:
         # Should extract email
         assert "scot@prefrontal.systems" in entities
 
-        extractor.nlp = original_nlp
-
-    def test_fallback_url_detection(self):
+    def test_fallback_url_detection(self, extractor, monkeypatch):
         """Test fallback extracts URLs."""
-        extractor = EntityExtractor()
-
         # Force fallback
-        original_nlp = extractor.nlp
-        extractor.nlp = None
+        monkeypatch.setattr(extractor, "nlp", None)
 
         test_url = "https://cortexgraph.dev"
         text = f"Check out {test_url} for documentation"
@@ -231,15 +226,12 @@ class TestFallbackPatternExtraction:
         # lgtm[py/incomplete-url-substring-sanitization]
         assert test_url in entities
 
-        extractor.nlp = original_nlp
-
 
 class TestEntityLimitingAndSorting:
     """Tests for max_entities limiting and sorting behavior."""
 
-    def test_max_entities_default(self):
+    def test_max_entities_default(self, extractor):
         """Test default max_entities=10."""
-        extractor = EntityExtractor()
         text = "Python JavaScript TypeScript Rust Go Java PostgreSQL MongoDB Redis SQLite FastAPI Django React Vue PyTorch TensorFlow"
 
         entities = extractor.extract(text)
@@ -247,9 +239,8 @@ class TestEntityLimitingAndSorting:
         # Should limit to 10
         assert len(entities) <= 10
 
-    def test_max_entities_custom_limit(self):
+    def test_max_entities_custom_limit(self, extractor):
         """Test custom max_entities limit."""
-        extractor = EntityExtractor()
         text = "Python JavaScript TypeScript Rust Go Java"
 
         entities = extractor.extract(text, max_entities=3)
@@ -257,13 +248,10 @@ class TestEntityLimitingAndSorting:
         # Should limit to 3
         assert len(entities) <= 3
 
-    def test_sorting_by_length(self):
+    def test_sorting_by_length(self, extractor, monkeypatch):
         """Test entities sorted by length (longest first)."""
-        extractor = EntityExtractor()
-
         # Force fallback to get predictable results
-        original_nlp = extractor.nlp
-        extractor.nlp = None
+        monkeypatch.setattr(extractor, "nlp", None)
 
         text = "PostgreSQL is better than Redis for my use case with TypeScript"
 
@@ -275,11 +263,8 @@ class TestEntityLimitingAndSorting:
             # First should be at least as long as second
             assert len(entities[0]) >= len(entities[1])
 
-        extractor.nlp = original_nlp
-
-    def test_deduplication(self):
+    def test_deduplication(self, extractor):
         """Test entities are deduplicated."""
-        extractor = EntityExtractor()
         text = "Python and Python and Python"
 
         entities = extractor.extract(text)
@@ -288,16 +273,58 @@ class TestEntityLimitingAndSorting:
         assert entities.count("python") == 1
 
 
+class TestBatchExtraction:
+    """Tests for extract_batch()."""
+
+    TEXTS = [
+        "I prefer PostgreSQL over MongoDB",
+        "",
+        "John Smith uses FastAPI at Acme Corporation",
+    ]
+
+    def test_batch_matches_single_extraction(self, extractor, monkeypatch):
+        """Test batch results equal per-text extract() on the regex fallback."""
+        monkeypatch.setattr(extractor, "nlp", None)
+
+        batch = extractor.extract_batch(self.TEXTS, max_entities=5)
+
+        assert batch == [extractor.extract(t, max_entities=5) for t in self.TEXTS]
+
+    def test_batch_uses_spacy_pipe(self, extractor, monkeypatch):
+        """Test spaCy runs once over the whole batch via nlp.pipe."""
+        from types import SimpleNamespace
+
+        def make_doc(text):
+            ents = [SimpleNamespace(text=w, label_="ORG") for w in text.split() if w == "Acme"]
+            return SimpleNamespace(ents=ents)
+
+        pipe_calls: list[list[str]] = []
+
+        class FakeNLP:
+            def __call__(self, text):
+                raise AssertionError("batch extraction should not call nlp per text")
+
+            def pipe(self, texts):
+                pipe_calls.append(list(texts))
+                return (make_doc(t) for t in texts)
+
+        monkeypatch.setattr(extractor, "nlp", FakeNLP())
+
+        batch = extractor.extract_batch(self.TEXTS)
+
+        # The blank text never reaches the pipeline
+        assert pipe_calls == [[self.TEXTS[0], self.TEXTS[2]]]
+        assert "acme" in batch[2] and "fastapi" in batch[2]
+        assert batch[1] == []
+
+
 class TestStopwordFiltering:
     """Tests for stopword removal."""
 
-    def test_stopwords_removed(self):
+    def test_stopwords_removed(self, extractor, monkeypatch):
         """Test common stopwords are filtered out."""
-        extractor = EntityExtractor()
-
         # Force fallback to test stopword filtering
-        original_nlp = extractor.nlp
-        extractor.nlp = None
+        monkeypatch.setattr(extractor, "nlp", None)
 
         text = "The API is better than the REST protocol"
 
@@ -308,41 +335,45 @@ class TestStopwordFiltering:
         assert "is" not in entities
         assert "than" not in entities
 
-        extractor.nlp = original_nlp
-
-    def test_stopwords_list_coverage(self):
+    def test_stopwords_list_coverage(self, extractor, monkeypatch):
         """Test all defined stopwords are filtered."""
-        extractor = EntityExtractor()
-
         # Force fallback
-        original_nlp = extractor.nlp
-        extractor.nlp = None
+        monkeypatch.setattr(extractor, "nlp", None)
 
-        text = "the a an and or but in on at to for"
+        text = "The, An, And, Or, But, In, On, At, To, For"
 
         entities = extractor.extract(text)
 
-        # All stopwords should be removed
-        stopwords = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for"}
-        for stopword in stopwords:
-            assert stopword not in entities
-
-        extractor.nlp = original_nlp
+        # The capitalized-word pattern matches them, so only filtering removes them
+        candidates = {match.lower() for match in extractor.fallback_regex.findall(text)}
+        assert candidates <= STOPWORDS
+        assert len(candidates) == 10
+        assert STOPWORDS.isdisjoint(entities)
+        assert entities == []
 
 
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
-    def test_empty_text(self):
+    def test_empty_text(self, extractor):
         """Test extraction from empty text."""
-        extractor = EntityExtractor()
         entities = extractor.extract("")
 
         assert entities == []
 
-    def test_no_entities_text(self):
+    @pytest.mark.parametrize("text", ["", "   ", "\n\t "])
+    def test_blank_text_skips_pipeline(self, extractor, monkeypatch, text):
+        """Test blank input returns early without running spaCy."""
+
+        def fail(_text):
+            raise AssertionError("nlp should not be called for blank text")
+
+        monkeypatch.setattr(extractor, "nlp", fail)
+
+        assert extractor.extract(text) == []
+
+    def test_no_entities_text(self, extractor):
         """Test text with no extractable entities."""
-        extractor = EntityExtractor()
         text = "this is just some regular text without any entities"
 
         entities = extractor.extract(text)
@@ -350,9 +381,8 @@ class TestEdgeCases:
         # Should return empty or minimal list
         assert isinstance(entities, list)
 
-    def test_special_characters_in_text(self):
+    def test_special_characters_in_text(self, extractor):
         """Test extraction with special characters."""
-        extractor = EntityExtractor()
         text = "I use PostgreSQL (v14.5) for my database! It's great."
 
         entities = extractor.extract(text)
@@ -360,9 +390,8 @@ class TestEdgeCases:
         # Should extract PostgreSQL despite special characters
         assert "postgresql" in entities
 
-    def test_multiline_text(self):
+    def test_multiline_text(self, extractor):
         """Test extraction from multiline text."""
-        extractor = EntityExtractor()
         text = """
         I prefer PostgreSQL for databases.
         FastAPI is my framework of choice.
@@ -375,18 +404,16 @@ class TestEdgeCases:
         assert "fastapi" in entities
         assert "python" in entities
 
-    def test_unicode_text(self):
+    def test_unicode_text(self, extractor):
         """Test extraction with unicode characters."""
-        extractor = EntityExtractor()
         text = "I use PostgreSQL for my café's database ☕"
 
         entities = extractor.extract(text)
 
         assert "postgresql" in entities
 
-    def test_very_long_text(self):
+    def test_very_long_text(self, extractor):
         """Test extraction from very long text."""
-        extractor = EntityExtractor()
         long_text = "I use Python " * 100 + "and PostgreSQL for databases"
 
         entities = extractor.extract(long_text)
@@ -423,11 +450,44 @@ class TestConvenienceFunction:
 
         assert entities == []
 
-    def test_extract_entities_creates_new_instance(self):
-        """Test convenience function creates new extractor each call."""
+    def test_extract_entities_independent_calls(self):
+        """Test convenience function calls don't leak entities into each other."""
         # Two calls should work independently
         entities1 = extract_entities("PostgreSQL and FastAPI")
         entities2 = extract_entities("MongoDB and Django")
 
         assert "postgresql" in entities1
         assert "mongodb" in entities2
+        assert "postgresql" not in entities2
+
+    def test_extract_entities_reuses_shared_extractor(self, monkeypatch):
+        """Test convenience function constructs its extractor only once."""
+        from cortexgraph.activation import entity_extraction
+
+        created: list[EntityExtractor] = []
+
+        class CountingExtractor(EntityExtractor):
+            def __init__(self) -> None:
+                super().__init__()
+                created.append(self)
+
+        monkeypatch.setattr(entity_extraction, "EntityExtractor", CountingExtractor)
+
+        extract_entities("PostgreSQL")
+        extract_entities("Redis")
+
+        assert len(created) == 1
+
+    def test_extract_entities_memoizes_results(self, monkeypatch):
+        """Test repeated inputs are served from cache as independent lists."""
+        first = extract_entities("I use Docker and Redis")
+        calls: list[str] = []
+        monkeypatch.setattr(
+            EntityExtractor, "extract", lambda self, text, max_entities=10: calls.append(text)
+        )
+
+        second = extract_entities("I use Docker and Redis")
+        second.append("mutated")
+
+        assert calls == []
+        assert extract_entities("I use Docker and Redis") == first
@@ -19,6 +19,12 @@ from cortexgraph.activation.models import (
 )
 
 
+def _expect_invalid(cls, **kwargs):
+    """Assert that constructing ``cls`` with ``kwargs`` fails validation."""
+    with pytest.raises(ValidationError):
+        cls(**kwargs)
+
+
 class TestActivationSignal:
     """Tests for ActivationSignal model."""
 
@@ -213,11 +219,9 @@ class TestMessageAnalysis:
 
     def test_confidence_out_of_range_fails(self):
         """Test confidence outside [0, 1] raises ValidationError."""
-        with pytest.raises(ValidationError):
-            MessageAnalysis(should_save=True, confidence=1.5, reasoning="test")
+        _expect_invalid(MessageAnalysis, should_save=True, confidence=1.5, reasoning="test")
 
-        with pytest.raises(ValidationError):
-            MessageAnalysis(should_save=False, confidence=-0.1, reasoning="test")
+        _expect_invalid(MessageAnalysis, should_save=False, confidence=-0.1, reasoning="test")
 
     def test_strength_valid_range(self):
         """Test suggested_strength accepts 1.0-2.0 range."""
@@ -234,15 +238,21 @@ class TestMessageAnalysis:
 
     def test_strength_out_of_range_fails(self):
         """Test suggested_strength outside [1, 2] raises ValidationError."""
-        with pytest.raises(ValidationError):
-            MessageAnalysis(
-                should_save=True, confidence=0.8, suggested_strength=0.5, reasoning="test"
-            )
+        _expect_invalid(
+            MessageAnalysis,
+            should_save=True,
+            confidence=0.8,
+            suggested_strength=0.5,
+            reasoning="test",
+        )
 
-        with pytest.raises(ValidationError):
-            MessageAnalysis(
-                should_save=True, confidence=0.8, suggested_strength=2.5, reasoning="test"
-            )
+        _expect_invalid(
+            MessageAnalysis,
+            should_save=True,
+            confidence=0.8,
+            suggested_strength=2.5,
+            reasoning="test",
+        )
 
     def test_strength_default_value(self):
         """Test suggested_strength defaults to 1.0."""
@@ -263,13 +273,13 @@ class TestMessageAnalysis:
 
         # 101 should fail
         entities_too_many = [f"entity{i}" for i in range(101)]
-        with pytest.raises(ValidationError):
-            MessageAnalysis(
-                should_save=True,
-                confidence=0.8,
-                suggested_entities=entities_too_many,
-                reasoning="test",
-            )
+        _expect_invalid(
+            MessageAnalysis,
+            should_save=True,
+            confidence=0.8,
+            suggested_entities=entities_too_many,
+            reasoning="test",
+        )
 
     def test_tags_max_length(self):
         """Test suggested_tags enforces max 50 items."""
@@ -282,13 +292,13 @@ class TestMessageAnalysis:
 
         # 51 should fail
         tags_too_many = [f"tag{i}" for i in range(51)]
-        with pytest.raises(ValidationError):
-            MessageAnalysis(
-                should_save=True,
-                confidence=0.8,
-                suggested_tags=tags_too_many,
-                reasoning="test",
-            )
+        _expect_invalid(
+            MessageAnalysis,
+            should_save=True,
+            confidence=0.8,
+            suggested_tags=tags_too_many,
+            reasoning="test",
+        )
 
     def test_reasoning_required(self):
         """Test reasoning field is required."""
@@ -300,15 +310,13 @@ class TestMessageAnalysis:
 
     def test_reasoning_min_length(self):
         """Test reasoning requires min 1 character."""
-        with pytest.raises(ValidationError):
-            MessageAnalysis(should_save=True, confidence=0.8, reasoning="")
+        _expect_invalid(MessageAnalysis, should_save=True, confidence=0.8, reasoning="")
 
     def test_reasoning_max_length(self):
         """Test reasoning enforces max 1000 chars."""
         long_reasoning = "x" * 1500
 
-        with pytest.raises(ValidationError):
-            MessageAnalysis(should_save=True, confidence=0.8, reasoning=long_reasoning)
+        _expect_invalid(MessageAnalysis, should_save=True, confidence=0.8, reasoning=long_reasoning)
 
     def test_phrase_signals_optional(self):
         """Test phrase_signals is optional and defaults to empty dict."""
@@ -381,11 +389,9 @@ class TestRecallAnalysis:
 
     def test_confidence_out_of_range_fails(self):
         """Test confidence outside [0, 1] raises ValidationError."""
-        with pytest.raises(ValidationError):
-            RecallAnalysis(should_search=True, confidence=1.5, reasoning="test")
+        _expect_invalid(RecallAnalysis, should_search=True, confidence=1.5, reasoning="test")
 
-        with pytest.raises(ValidationError):
-            RecallAnalysis(should_search=False, confidence=-0.1, reasoning="test")
+        _expect_invalid(RecallAnalysis, should_search=False, confidence=-0.1, reasoning="test")
 
     def test_suggested_query_optional(self):
         """Test suggested_query is optional and defaults to empty."""
@@ -396,10 +402,13 @@ class TestRecallAnalysis:
         """Test suggested_query enforces max 1000 chars."""
         long_query = "x" * 1500
 
-        with pytest.raises(ValidationError):
-            RecallAnalysis(
-                should_search=True, confidence=0.8, suggested_query=long_query, reasoning="test"
-            )
+        _expect_invalid(
+            RecallAnalysis,
+            should_search=True,
+            confidence=0.8,
+            suggested_query=long_query,
+            reasoning="test",
+        )
 
     def test_tags_max_length(self):
         """Test suggested_tags enforces max 50 items."""
@@ -410,13 +419,13 @@ class TestRecallAnalysis:
         assert len(analysis.suggested_tags) == 50
 
         tags_too_many = [f"tag{i}" for i in range(51)]
-        with pytest.raises(ValidationError):
-            RecallAnalysis(
-                should_search=True,
-                confidence=0.8,
-                suggested_tags=tags_too_many,
-                reasoning="test",
-            )
+        _expect_invalid(
+            RecallAnalysis,
+            should_search=True,
+            confidence=0.8,
+            suggested_tags=tags_too_many,
+            reasoning="test",
+        )
 
     def test_entities_max_length(self):
         """Test suggested_entities enforces max 100 items."""
@@ -427,13 +436,13 @@ class TestRecallAnalysis:
         assert len(analysis.suggested_entities) == 100
 
         entities_too_many = [f"entity{i}" for i in range(101)]
-        with pytest.raises(ValidationError):
-            RecallAnalysis(
-                should_search=True,
-                confidence=0.8,
-                suggested_entities=entities_too_many,
-                reasoning="test",
-            )
+        _expect_invalid(
+            RecallAnalysis,
+            should_search=True,
+            confidence=0.8,
+            suggested_entities=entities_too_many,
+            reasoning="test",
+        )
 
     def test_reasoning_required(self):
         """Test reasoning field is required."""
@@ -446,13 +455,13 @@ class TestRecallAnalysis:
     def test_reasoning_constraints(self):
         """Test reasoning min/max length constraints."""
         # Empty reasoning
-        with pytest.raises(ValidationError):
-            RecallAnalysis(should_search=True, confidence=0.8, reasoning="")
+        _expect_invalid(RecallAnalysis, should_search=True, confidence=0.8, reasoning="")
 
         # Too long reasoning
         long_reasoning = "x" * 1500
-        with pytest.raises(ValidationError):
-            RecallAnalysis(should_search=True, confidence=0.8, reasoning=long_reasoning)
+        _expect_invalid(
+            RecallAnalysis, should_search=True, confidence=0.8, reasoning=long_reasoning
+        )
 
     def test_phrase_signals_optional(self):
         """Test phrase_signals is optional and defaults to empty dict."""
@@ -666,3 +666,115 @@ class TestRelationshipDiscoveryUnit:
             result = discovery._get_memory("nonexistent")
 
             assert result is None
+
+    def test_process_batch_matches_process_item_order(
+        self,
+        mock_memory_with_entities: MagicMock,
+        mock_memory_overlapping: MagicMock,
+        mock_memory_no_overlap: MagicMock,
+    ) -> None:
+        """process_batch returns one result per pair, in input order."""
+        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+
+        mock_storage = MagicMock()
+        mock_storage.memories = {
+            "mem-entity-1": mock_memory_with_entities,
+            "mem-entity-2": mock_memory_overlapping,
+            "mem-entity-3": mock_memory_no_overlap,
+        }
+        mock_storage.relations = {}
+
+        with patch(
+            "cortexgraph.agents.relationship_discovery.get_storage",
+            return_value=mock_storage,
+        ):
+            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=1)
+            discovery._storage = mock_storage
+
+            pair_ids = ["mem-entity-2:mem-entity-3", "mem-entity-1:mem-entity-2"]
+            results = discovery.process_batch(pair_ids)
+
+            assert [(r.from_memory_id, r.to_memory_id) for r in results] == [
+                ("mem-entity-2", "mem-entity-3"),
+                ("mem-entity-1", "mem-entity-2"),
+            ]
+            for pair_id, result in zip(pair_ids, results, strict=True):
+                expected = discovery.process_item(pair_id)
+                assert result.strength == expected.strength
+                assert result.confidence == expected.confidence
+                assert result.reasoning == expected.reasoning
+
+            assert discovery.process_batch([]) == []
+
+    def test_process_batch_respects_rate_limit_and_stats(
+        self,
+        mock_memory_with_entities: MagicMock,
+        mock_memory_overlapping: MagicMock,
+        mock_memory_no_overlap: MagicMock,
+    ) -> None:
+        """process_batch throttles, counts errors and stops when the limiter times out."""
+        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+
+        mock_storage = MagicMock()
+        mock_storage.memories = {
+            "mem-entity-1": mock_memory_with_entities,
+            "mem-entity-2": mock_memory_overlapping,
+            "mem-entity-3": mock_memory_no_overlap,
+        }
+        mock_storage.relations = {}
+
+        with patch(
+            "cortexgraph.agents.relationship_discovery.get_storage",
+            return_value=mock_storage,
+        ):
+            discovery = RelationshipDiscovery(dry_run=True, min_shared_entities=1, rate_limit=2)
+            discovery._storage = mock_storage
+            discovery._rate_limiter.wait_and_acquire = MagicMock(return_value=False)
+
+            results = discovery.process_batch(
+                ["not-a-pair", "mem-entity-1:mem-entity-2", "mem-entity-2:mem-entity-3"]
+            )
+
+            assert [(r.from_memory_id, r.to_memory_id) for r in results] == [
+                ("mem-entity-1", "mem-entity-2")
+            ]
+            discovery._rate_limiter.wait_and_acquire.assert_called_once()
+            assert discovery.get_stats() == {
+                "processed": 1,
+                "skipped": 0,
+                "errors": 1,
+                "rate_limit_remaining": 0,
+            }
+
+    def test_uses_injected_storage_and_beads_callables(
+        self,
+        mock_memory_with_entities: MagicMock,
+        mock_memory_overlapping: MagicMock,
+    ) -> None:
+        """Constructor-injected storage and beads callables replace the module defaults."""
+        from cortexgraph.agents.relationship_discovery import RelationshipDiscovery
+
+        mock_storage = MagicMock()
+        mock_storage.memories = {
+            "mem-entity-1": mock_memory_with_entities,
+            "mem-entity-2": mock_memory_overlapping,
+        }
+        mock_storage.relations = {}
+        create_issue = MagicMock(return_value="injected-issue")
+        close = MagicMock()
+
+        discovery = RelationshipDiscovery(
+            dry_run=False,
+            min_confidence=0.0,
+            storage=mock_storage,
+            create_issue=create_issue,
+            close_issue=close,
+        )
+
+        assert discovery.storage is mock_storage
+        result = discovery.process_item("mem-entity-1:mem-entity-2")
+
+        assert result.beads_issue_id == "injected-issue"
+        create_issue.assert_called_once()
+        close.assert_called_once()
+        mock_storage.create_relation.assert_called_once()